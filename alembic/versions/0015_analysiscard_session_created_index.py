@@ -0,0 +1,48 @@
+"""analysiscard (session_id, created_at) 복합 인덱스 추가
+
+요약/카드 목록은 session_id로 거르고 created_at으로 정렬한다. 정렬 컬럼까지 인덱스에
+포함해 정렬 노드를 없애고, postgres에서는 작은 고정폭 컬럼(card_id, risk_level)을
+INCLUDE해 목록 메타데이터 조회가 힙을 덜 타도록 한다. summary/JSON 컬럼은 btree
+튜플 크기 제한(~2.7KB)에 걸려 INSERT가 실패할 수 있어 INCLUDE하지 않는다.
+
+Revision ID: 0015_analysiscard_session_created_index
+Revises: 0014_user_need_selection_session_id
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0015_analysiscard_session_created_index"
+down_revision = "0014_user_need_selection_session_id"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_analysiscard_session_created"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없다.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "analysiscard",
+                ["session_id", "created_at"],
+                postgresql_include=["card_id", "risk_level"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(INDEX_NAME, "analysiscard", ["session_id", "created_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX_NAME,
+                table_name="analysiscard",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index(INDEX_NAME, table_name="analysiscard")
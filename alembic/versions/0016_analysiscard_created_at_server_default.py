@@ -0,0 +1,38 @@
+"""analysiscard.created_at에 server_default(현재 UTC 시각) 추가
+
+INSERT에서 created_at을 생략하면 DB가 채운다. 앱은 RETURNING(eager_defaults)으로
+값을 돌려받으므로 파이썬 쪽에서 datetime을 만들 필요가 없다.
+
+Revision ID: 0016_analysiscard_created_at_server_default
+Revises: 0015_analysiscard_session_created_index
+Create Date: 2026-10-15
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.functions import utcnow
+
+revision = "0016_analysiscard_created_at_server_default"
+down_revision = "0015_analysiscard_session_created_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("analysiscard") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=utcnow(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("analysiscard") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,75 @@
+"""refreshtoken.jti/replaced_by를 네이티브 UUID로, 활성 RT 부분 인덱스 추가
+
+jti는 항상 uuid4 문자열이었으므로 postgres에서는 USING jti::uuid로 그대로 변환된다
+(36바이트 varchar → 16바이트 uuid). 로그아웃/재사용 탐지가 훑는
+user_id + revoked_at IS NULL 행만 담는 부분 인덱스를 함께 만든다.
+
+Revision ID: 0017_refreshtoken_uuid_jti
+Revises: 0016_analysiscard_created_at_server_default
+Create Date: 2026-10-15
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0017_refreshtoken_uuid_jti"
+down_revision = "0016_analysiscard_created_at_server_default"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_refreshtoken_user_active"
+_ACTIVE = sa.text("revoked_at IS NULL")
+
+
+def _dashed(col: str) -> str:
+    # 32자리 hex → 8-4-4-4-12 형태 (sqlite 다운그레이드용)
+    return (
+        f"substr({col}, 1, 8) || '-' || substr({col}, 9, 4) || '-' || "
+        f"substr({col}, 13, 4) || '-' || substr({col}, 17, 4) || '-' || substr({col}, 21)"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE refreshtoken ALTER COLUMN jti TYPE uuid USING jti::uuid")
+        op.execute(
+            "ALTER TABLE refreshtoken ALTER COLUMN replaced_by TYPE uuid USING replaced_by::uuid"
+        )
+    else:
+        # sqlite의 sa.Uuid는 하이픈 없는 32자리 hex로 저장한다.
+        op.execute("UPDATE refreshtoken SET jti = replace(jti, '-', '')")
+        op.execute(
+            "UPDATE refreshtoken SET replaced_by = replace(replaced_by, '-', '') "
+            "WHERE replaced_by IS NOT NULL"
+        )
+        with op.batch_alter_table("refreshtoken") as batch_op:
+            batch_op.alter_column("jti", existing_type=sa.String(), type_=sa.Uuid())
+            batch_op.alter_column("replaced_by", existing_type=sa.String(), type_=sa.Uuid())
+
+    op.create_index(
+        INDEX_NAME,
+        "refreshtoken",
+        ["user_id"],
+        postgresql_where=_ACTIVE,
+        sqlite_where=_ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name="refreshtoken")
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TABLE refreshtoken ALTER COLUMN jti TYPE varchar USING jti::text")
+        op.execute(
+            "ALTER TABLE refreshtoken ALTER COLUMN replaced_by TYPE varchar USING replaced_by::text"
+        )
+    else:
+        with op.batch_alter_table("refreshtoken") as batch_op:
+            batch_op.alter_column("jti", existing_type=sa.Uuid(), type_=sa.String())
+            batch_op.alter_column("replaced_by", existing_type=sa.Uuid(), type_=sa.String())
+        op.execute(f"UPDATE refreshtoken SET jti = {_dashed('jti')}")
+        op.execute(
+            f"UPDATE refreshtoken SET replaced_by = {_dashed('replaced_by')} "
+            "WHERE replaced_by IS NOT NULL"
+        )
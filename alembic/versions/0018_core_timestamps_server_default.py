@@ -0,0 +1,46 @@
+"""user/task/refreshtoken.created_at, emotionsession.started_at,
+emotionstep.created_at에 server_default(현재 UTC 시각) 추가
+
+0016과 같은 방식: INSERT에서 컬럼을 생략하면 DB가 채우고,
+앱은 eager_defaults(RETURNING)로 값을 돌려받는다.
+
+Revision ID: 0018_core_timestamps_server_default
+Revises: 0017_refreshtoken_uuid_jti
+Create Date: 2026-10-15
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.functions import utcnow
+
+revision = "0018_core_timestamps_server_default"
+down_revision = "0017_refreshtoken_uuid_jti"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    ("user", "created_at"),
+    ("task", "created_at"),
+    ("refreshtoken", "created_at"),
+    ("emotionsession", "started_at"),
+    ("emotionstep", "created_at"),
+)
+
+
+def _set_server_default(server_default) -> None:
+    for table, column in COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=server_default,
+            )
+
+
+def upgrade() -> None:
+    _set_server_default(utcnow())
+
+
+def downgrade() -> None:
+    _set_server_default(None)
@@ -0,0 +1,47 @@
+"""emotionsession (user_id, started_at, session_id) 복합 인덱스 추가
+
+세션 목록/진행 중 세션 조회는 user_id로 거르고 started_at 내림차순으로 정렬하며,
+목록 keyset 커서는 (started_at, session_id)로 비교한다. 세 컬럼을 모두 인덱스에 넣어
+정렬 없이 인덱스 역방향 스캔으로 페이지를 읽게 한다.
+
+Revision ID: 0019_emotionsession_user_started_index
+Revises: 0018_core_timestamps_server_default
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0019_emotionsession_user_started_index"
+down_revision = "0018_core_timestamps_server_default"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_emotionsession_user_started"
+COLUMNS = ["user_id", "started_at", "session_id"]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없다.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "emotionsession",
+                COLUMNS,
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index(INDEX_NAME, "emotionsession", COLUMNS)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX_NAME,
+                table_name="emotionsession",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index(INDEX_NAME, table_name="emotionsession")
@@ -6,7 +6,9 @@ from uuid import UUID, uuid4
 from datetime import datetime
 
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, JSON, UniqueConstraint
+from sqlalchemy import Column, DateTime, Index, JSON, UniqueConstraint
+
+from app.db.functions import utcnow
 
 from app.backend.models.emotion import EmotionSession
 
@@ -14,7 +16,15 @@ class AnalysisCard(SQLModel, table=True):
     __tablename__ = "analysiscard"
     __table_args__ = (
         UniqueConstraint("session_id", name="uq_analysiscard_session_id"),
+        Index(
+            "ix_analysiscard_session_created",
+            "session_id",
+            "created_at",
+            postgresql_include=["card_id", "risk_level"],
+        ),
     )
+    # INSERT ... RETURNING으로 서버가 채운 created_at을 flush 시점에 바로 받는다.
+    __mapper_args__ = {"eager_defaults": True}
 
     card_id: UUID = Field(
         default_factory=uuid4,
@@ -24,7 +34,11 @@ class AnalysisCard(SQLModel, table=True):
         foreign_key="emotionsession.session_id",
         index=True,
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # 값은 DB가 채운다 (server_default). 명시적으로 넘기면 그 값을 쓴다.
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
 
     summary: Optional[str] = None
     core_emotions: Optional[List[Any]] = Field(
@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import lambda_stmt
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
@@ -10,13 +11,16 @@ from app.analyze import models as m
 from app.analyze import schemas as sc
 from app.db.session import get_session as get_db
 from app.analyze.services import risk as risk_service
-from app.analyze.services.card_content import has_meaningful_content
+from app.analyze.services.card_content import CONTENT_FIELDS, has_meaningful_content
 from app.analyze.services.llm_card import analyze_dialogue_to_card
+from app.analyze.services.summaries import CARD_OUT_COLUMNS
 from app.backend.dependencies.auth import get_current_user
 from app.backend.models.emotion import EmotionStep
 
 router = APIRouter(prefix="/api", tags=["cards"])
 
+_CARD_CONTENT_KEYS = frozenset(CONTENT_FIELDS)
+
 
 def _get_session_or_404(
     db: Session,
@@ -31,52 +35,111 @@ def _get_session_or_404(
     return session
 
 
+def _get_sessions(db: Session, session_ids: list[UUID]) -> dict[UUID, m.EmotionSession]:
+    # 세션마다 db.get을 돌리지 않고 IN (...) 한 번으로 가져온다.
+    rows = db.exec(
+        select(m.EmotionSession).where(m.EmotionSession.session_id.in_(session_ids))
+    ).all()
+    return {row.session_id: row for row in rows}
+
+
+def _get_sessions_or_404(
+    db: Session,
+    session_ids: list[UUID],
+    current_user_id: str,
+) -> dict[UUID, m.EmotionSession]:
+    sessions = _get_sessions(db, session_ids)
+    if len(sessions) != len(set(session_ids)):
+        raise HTTPException(status_code=404, detail="session not found")
+    if any(str(session.user_id) != current_user_id for session in sessions.values()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="forbidden")
+    return sessions
+
+
 def _has_meaningful_card_content(payload: sc.CardCreate) -> bool:
     return has_meaningful_content(payload.model_dump())
 
 
 def _card_has_meaningful_content(card: m.AnalysisCard) -> bool:
-    return has_meaningful_content(card.model_dump())
+    return has_meaningful_content({name: getattr(card, name) for name in CONTENT_FIELDS})
 
 
-def _store_card(db: Session, session_id: UUID, payload: sc.CardCreate) -> sc.CardOut:
-    risk_flag, risk_level = risk_service.risk_from_payload(payload.model_dump())
+def _build_card(session_id: UUID, payload: sc.CardCreate) -> m.AnalysisCard:
+    # 페이로드는 한 번만 dict로 직렬화해 위험도 스캔과 JSON 컬럼 값에 함께 쓴다.
+    data = payload.model_dump(include=_CARD_CONTENT_KEYS)
+    risk_flag, risk_level = risk_service.risk_from_payload(data)
 
-    card = m.AnalysisCard(
+    return m.AnalysisCard(
         session_id=session_id,
-        summary=payload.summary,
-        core_emotions=[e.model_dump() for e in payload.core_emotions] if payload.core_emotions else None,
-        situation=payload.situation,
-        situation_steps=[s.model_dump() for s in payload.situation_steps] if payload.situation_steps else None,
-        physical_reactions=[r.model_dump() for r in payload.physical_reactions] if payload.physical_reactions else None,
-        behavior_patterns=[b.model_dump() for b in payload.behavior_patterns] if payload.behavior_patterns else None,
-        coping_actions=payload.coping_actions,
-        tags=payload.tags,
-        insight=payload.insight,
-        thoughts=[t.model_dump() for t in payload.thoughts] if payload.thoughts else None,
+        summary=data["summary"],
+        core_emotions=data["core_emotions"] or None,
+        situation=data["situation"],
+        situation_steps=data["situation_steps"] or None,
+        physical_reactions=data["physical_reactions"] or None,
+        behavior_patterns=data["behavior_patterns"] or None,
+        coping_actions=data["coping_actions"],
+        tags=data["tags"],
+        insight=data["insight"],
+        thoughts=data["thoughts"] or None,
         exportable=True,
         risk_flag=risk_flag,
         risk_level=risk_level,
     )
+
+
+def _apply_card_to_session(session: m.EmotionSession, payload: sc.CardCreate) -> None:
+    if payload.core_emotions:
+        session.emotion_label = payload.core_emotions[0].primary
+    topic_source = payload.summary or payload.situation
+    session.topic = topic_source[:100] if topic_source else None
+    session.trigger_summary = payload.situation
+    session.insight_summary = payload.insight
+
+
+def _store_card(db: Session, session_id: UUID, payload: sc.CardCreate) -> sc.CardOut:
+    card = _build_card(session_id, payload)
     db.add(card)
 
     session = db.get(m.EmotionSession, session_id)
     if session:
-        if payload.core_emotions:
-            session.emotion_label = payload.core_emotions[0].primary
-        topic_source = payload.summary or payload.situation
-        session.topic = topic_source[:100] if topic_source else None
-        session.trigger_summary = payload.situation
-        session.insight_summary = payload.insight
+        _apply_card_to_session(session, payload)
         db.add(session)
 
+    # eager_defaults라 flush의 INSERT ... RETURNING이 created_at까지 채운다.
+    # commit 뒤 refresh로 한 번 더 SELECT하지 않도록 flush 직후에 직렬화한다.
     try:
-        db.commit()
+        db.flush()
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=409, detail="card already exists for this session")
-    db.refresh(card)
-    return sc.CardOut.model_validate(card, from_attributes=True)
+    out = sc.CardOut.model_validate(card, from_attributes=True)
+    db.commit()
+    return out
+
+
+def _store_cards(
+    db: Session,
+    items: list[sc.CardBatchItem],
+    sessions: dict[UUID, m.EmotionSession],
+) -> list[sc.CardOut]:
+    """여러 세션의 카드를 한 트랜잭션으로 저장한다.
+
+    PK(card_id)가 클라이언트에서 정해지므로 flush 시 INSERT가 executemany로 묶인다.
+    commit 후에는 속성이 만료되므로 직렬화는 flush 직후에 끝낸다.
+    """
+    cards = [_build_card(item.session_id, item) for item in items]
+    db.add_all(cards)
+    for item in items:
+        _apply_card_to_session(sessions[item.session_id], item)
+
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="card already exists for this session")
+    out = [sc.CardOut.model_validate(card, from_attributes=True) for card in cards]
+    db.commit()
+    return out
 
 
 def _analyze_and_store_card(
@@ -88,6 +151,9 @@ def _analyze_and_store_card(
     if not turns:
         raise HTTPException(status_code=400, detail="conversation history is empty")
 
+    # LLM 호출(수 초) 동안 풀 커넥션을 붙잡지 않도록 읽기 트랜잭션을 먼저 끝낸다.
+    # 저장 단계에서 세션이 새 커넥션을 다시 체크아웃한다.
+    db.commit()
     payload = analyze_dialogue_to_card(turns=turns, title_hint=title_hint)
     if not _has_meaningful_card_content(payload):
         raise HTTPException(status_code=502, detail="card generation failed")
@@ -208,6 +274,22 @@ def create_card_auto_from_session(
     )
 
 
+@router.post("/cards/bulk", response_model=list[sc.CardOut])
+def create_cards_bulk(
+    body: sc.CardBatchCreate,
+    db: Session = Depends(get_db),
+    current_user_id: str = Depends(get_current_user),
+):
+    # analysiscard.session_id는 UNIQUE라 세션당 카드 1장 → 배치는 여러 세션에 걸친다.
+    session_ids = [item.session_id for item in body.items]
+    if len(set(session_ids)) != len(session_ids):
+        raise HTTPException(status_code=400, detail="duplicate session_id in batch")
+    sessions = _get_sessions_or_404(db, session_ids, current_user_id)
+    if not all(_has_meaningful_card_content(item) for item in body.items):
+        raise HTTPException(status_code=400, detail="card content is empty")
+    return _store_cards(db=db, items=body.items, sessions=sessions)
+
+
 @router.get("/sessions/{session_id}/cards", response_model=list[sc.CardOut])
 def list_cards(
     session_id: UUID,
@@ -215,17 +297,14 @@ def list_cards(
     current_user_id: str = Depends(get_current_user),
 ):
     _get_session_or_404(db, session_id, current_user_id)
-    stmt = (
-        select(m.AnalysisCard)
+    stmt = lambda_stmt(
+        lambda: select(*CARD_OUT_COLUMNS)
         .where(m.AnalysisCard.session_id == session_id)
         .order_by(m.AnalysisCard.created_at.desc())
     )
-    rows = db.exec(stmt).all()
-    return [
-        sc.CardOut.model_validate(row, from_attributes=True)
-        for row in rows
-        if _card_has_meaningful_content(row)
-    ]
+    rows = db.exec(stmt).mappings().all()
+    # 행 매핑을 그대로 돌려주고 CardOut 검증은 response_model에서 한 번만 한다.
+    return [row for row in rows if has_meaningful_content(row)]
 
 
 @router.get("/cards/{card_id}", response_model=sc.CardOut)
@@ -238,4 +317,4 @@ def get_card(
     if not card or not _card_has_meaningful_content(card):
         raise HTTPException(status_code=404, detail="card not found")
     _get_session_or_404(db, card.session_id, current_user_id)
-    return sc.CardOut.model_validate(card, from_attributes=True)
+    return card
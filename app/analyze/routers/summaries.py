@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.engine import RowMapping
 from sqlmodel import Session
 
 from app.db.session import get_session as get_db
@@ -15,19 +16,43 @@ from app.backend.dependencies.auth import get_current_user
 
 router = APIRouter(prefix="/api", tags=["summaries"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-def _serialize_cards(rows: list) -> list[sc.CardOut]:
-    return [
-        sc.CardOut.model_validate(row, from_attributes=True)
-        for row in rows
-        if has_meaningful_content(row.model_dump())
-    ]
+
+def _serialize_cards(rows: list[RowMapping]) -> list[RowMapping]:
+    # 검증/직렬화는 response_model에서 한 번만 수행된다.
+    return [row for row in rows if has_meaningful_content(row)]
+
+
+def _parse_cursor(
+    cursor: Optional[str],
+    offset: Optional[int],
+) -> Optional[summary_service.SummaryCursor]:
+    if cursor is None:
+        return None
+    if offset is not None:
+        raise HTTPException(status_code=400, detail="use either cursor or offset")
+    try:
+        return summary_service.decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+
+def _set_next_cursor(response: Response, rows: list[RowMapping], limit: Optional[int]) -> None:
+    # 빈 카드 필터링 전의 마지막 행 기준으로 커서를 잡아야 건너뛰는 행이 없다.
+    if limit is not None and len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = summary_service.encode_cursor(
+            last["created_at"], last["card_id"]
+        )
 
 
 @router.get("/summaries", response_model=list[sc.CardOut])
 def list_summaries(
+    response: Response,
     limit: Optional[int] = Query(default=None, gt=0),
     offset: Optional[int] = Query(default=None, ge=0),
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
     current_user_id: str = Depends(get_current_user),
 ):
@@ -36,15 +61,19 @@ def list_summaries(
         user_id=UUID(current_user_id),
         limit=limit,
         offset=offset,
+        cursor=_parse_cursor(cursor, offset),
     )
+    _set_next_cursor(response, rows, limit)
     return _serialize_cards(rows)
 
 
 @router.get("/sessions/{session_id}/summaries", response_model=list[sc.CardOut])
 def list_session_summaries(
     session_id: UUID,
+    response: Response,
     limit: Optional[int] = Query(default=None, gt=0),
     offset: Optional[int] = Query(default=None, ge=0),
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
     current_user_id: str = Depends(get_current_user),
 ):
@@ -54,5 +83,7 @@ def list_session_summaries(
         session_id=session_id,
         limit=limit,
         offset=offset,
+        cursor=_parse_cursor(cursor, offset),
     )
+    _set_next_cursor(response, rows, limit)
     return _serialize_cards(rows)
@@ -66,6 +66,23 @@ class CardCreate(BaseModel):
     thoughts: Optional[List[ThoughtEntry]] = None
 
 
+# 일괄 저장 시 한 요청에 담을 수 있는 최대 카드 수
+CARD_BATCH_MAX_ITEMS = 100
+
+
+class CardBatchItem(CardCreate):
+    session_id: UUID
+
+
+class CardBatchCreate(BaseModel):
+    items: List[CardBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=CARD_BATCH_MAX_ITEMS,
+        description="세션별 카드 목록 (세션당 카드 1장)",
+    )
+
+
 class CardOut(BaseModel):
     card_id: UUID
     session_id: UUID
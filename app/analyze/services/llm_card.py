@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 from typing import List
 
@@ -335,18 +336,35 @@ class _LLMCardPayload(BaseModel):
 
 
 
-def _format_dialogue(turns: List[sc.ConversationTurn]) -> str:
-    lines: List[str] = []
+_SPEAKER_NAMES: dict[str, str] = {"USER": "User", "NOA": "Noa"}
+
+
+def _speaker_name(speaker: str) -> str:
+    upper = speaker.upper()
+    return _SPEAKER_NAMES.get(upper, upper)
+
+
+_PROMPT_HEADER = (
+    "Analyze the counseling conversation below and return only JSON that matches the schema.\n\n"
+    "Output rule: keep schema keys in English, but write every summary, label, sentence, and list item in Korean.\n\n"
+)
+
+
+def _build_user_prompt(turns: List[sc.ConversationTurn], title_hint: str | None = None) -> str:
+    # 긴 세션에서 턴별 문자열 리스트와 f-string 보간으로 대화 로그를 두 번 복사하지 않도록
+    # 버퍼 하나에 바로 써 넣는다.
+    buf = io.StringIO()
+    buf.write(_PROMPT_HEADER)
+    if title_hint:
+        buf.write(f"Title hint: {title_hint}\n\n")
+    buf.write("[Conversation Start]\n")
     for turn in turns:
-        speaker = turn.speaker.upper()
-        if speaker == "USER":
-            name = "User"
-        elif speaker == "NOA":
-            name = "Noa"
-        else:
-            name = speaker
-        lines.append(f"{name}: {turn.text}")
-    return "\n".join(lines)
+        buf.write(_speaker_name(turn.speaker))
+        buf.write(": ")
+        buf.write(turn.text)
+        buf.write("\n")
+    buf.write("[Conversation End]")
+    return buf.getvalue()
 
 
 def _build_fallback_card() -> sc.CardCreate:
@@ -362,16 +380,7 @@ def analyze_dialogue_to_card(
     if not turns:
         raise ValueError("conversation_log is empty.")
 
-    dialogue_text = _format_dialogue(turns)
-    hint_block = f"Title hint: {title_hint}\n\n" if title_hint else ""
-    user_prompt = (
-        "Analyze the counseling conversation below and return only JSON that matches the schema.\n\n"
-        "Output rule: keep schema keys in English, but write every summary, label, sentence, and list item in Korean.\n\n"
-        f"{hint_block}"
-        "[Conversation Start]\n"
-        f"{dialogue_text}\n"
-        "[Conversation End]"
-    )
+    user_prompt = _build_user_prompt(turns, title_hint)
 
     last_exc: Exception | None = None
     # 트랜지언트 오류(네트워크, rate limit, JSON 잘림 등) 한 번으로 빈 fallback
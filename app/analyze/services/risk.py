@@ -1,17 +1,33 @@
 # app/services/risk.py
 from __future__ import annotations
 
+import re
+
 _LOW = ["힘들", "슬픔", "우울", "불안", "짜증"]
 _MEDIUM = ["죽고", "자해", "해치", "절망", "포기"]
-# score()는 입력 텍스트의 공백을 전부 제거하고 매칭하므로, 패턴 쪽도 공백을
-# 제거해 둬야 한다 — 그러지 않으면 공백이 포함된 패턴은 절대 매칭되지 않는다.
+# 입력의 공백은 매칭에 영향을 주지 않는다. 패턴 쪽 공백도 무시하도록 미리 제거한다.
 _HIGH = [p.replace(" ", "") for p in ["나는 죽", "곧 끝낼", "방법을 찾았", "유서", "뛰어내"]]
 
+
+def _compile(keywords: list[str]) -> re.Pattern[str]:
+    # 글자 사이에 " *"를 넣어 입력 공백 제거(translate)와 매칭을 한 번의 스캔으로 끝낸다.
+    # 각 키워드는 리터럴 글자열이라 역추적이 키워드 길이 이상으로 커지지 않는다.
+    return re.compile("|".join(" *".join(map(re.escape, k)) for k in keywords))
+
+
+# 높은 단계부터 검사해 처음 걸리는 단계에서 바로 끝낸다.
+_LEVEL_PATTERNS = (
+    ("HIGH", _compile(_HIGH)),
+    ("MEDIUM", _compile(_MEDIUM)),
+    ("LOW", _compile(_LOW)),
+)
+
+
 def score(text: str) -> str:
-    t = (text or "").replace(" ", "")
-    if any(k in t for k in _HIGH): return "HIGH"
-    if any(k in t for k in _MEDIUM): return "MEDIUM"
-    if any(k in t for k in _LOW): return "LOW"
+    t = text or ""
+    for level, pattern in _LEVEL_PATTERNS:
+        if pattern.search(t):
+            return level
     return "NONE"
 
 def risk_from_payload(payload: dict) -> tuple[bool, str]:
@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+import base64
+from datetime import datetime
 from uuid import UUID
 from typing import Optional
 
+from sqlalchemy import lambda_stmt, tuple_
+from sqlalchemy.engine import RowMapping
 from sqlmodel import Session, select
 
 from app.analyze import models as m
+from app.analyze import schemas as sc
 from app.backend.models.emotion import EmotionSession
 
+# CardOut 응답에 필요한 컬럼만 조회한다 (ORM 인스턴스/identity map 생성 생략)
+CARD_OUT_COLUMNS = tuple(getattr(m.AnalysisCard, name) for name in sc.CardOut.model_fields)
+
+
+SummaryCursor = tuple[datetime, UUID]
+
+
+def encode_cursor(created_at: datetime, card_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{card_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> SummaryCursor:
+    """encode_cursor()의 역. 형식이 틀리면 ValueError."""
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        created_at, card_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(card_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("invalid cursor") from exc
+
 
 def list_summaries(
     db: Session,
@@ -16,17 +42,26 @@ def list_summaries(
     session_id: Optional[UUID] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> list[m.AnalysisCard]:
-    stmt = (
-        select(m.AnalysisCard)
+    cursor: Optional[SummaryCursor] = None,
+) -> list[RowMapping]:
+    # (created_at, card_id) 내림차순 keyset 페이지네이션. offset은 구 클라이언트 호환용.
+    # lambda_stmt: 구문 생성/캐시 키 계산을 호출마다 하지 않고, 클로저 값만 바인드된다.
+    stmt = lambda_stmt(
+        lambda: select(*CARD_OUT_COLUMNS)
         .join(EmotionSession, EmotionSession.session_id == m.AnalysisCard.session_id)
         .where(EmotionSession.user_id == user_id)
-        .order_by(m.AnalysisCard.created_at.desc())
+        .order_by(m.AnalysisCard.created_at.desc(), m.AnalysisCard.card_id.desc())
     )
     if session_id is not None:
-        stmt = stmt.where(m.AnalysisCard.session_id == session_id)
+        stmt += lambda s: s.where(m.AnalysisCard.session_id == session_id)
+    if cursor is not None:
+        cursor_created_at, cursor_card_id = cursor
+        stmt += lambda s: s.where(
+            tuple_(m.AnalysisCard.created_at, m.AnalysisCard.card_id)
+            < tuple_(cursor_created_at, cursor_card_id)
+        )
     if offset is not None:
-        stmt = stmt.offset(offset)
+        stmt += lambda s: s.offset(offset)
     if limit is not None:
-        stmt = stmt.limit(limit)
-    return db.exec(stmt).all()
+        stmt += lambda s: s.limit(limit)
+    return db.exec(stmt).mappings().all()
@@ -0,0 +1,50 @@
+"""인증/쿠키 관련 환경변수를 import 시 한 번만 읽어 두는 설정 객체."""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    v = os.getenv(key)
+    if v is None:
+        return default
+    return v.lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSettings:
+    google_client_id: str
+    google_client_secret: str
+    google_redirect_uri: str
+    # 로그인 응답의 expires_in / AT 쿠키 max-age (분)
+    access_token_expire_minutes: int
+    # AT를 쿠키로도 내려줄지(웹 혼용 환경에서만 권장; 기본 False)
+    auth_set_cookie_on_post: bool
+    # AT 쿠키 Secure 플래그 (배포시 true 권장)
+    cookie_secure: bool
+    refresh_cookie_name: str
+    # RT 쿠키 Secure 플래그 — 개발에서 http라면 SECURE_COOKIE=false 필요
+    secure_refresh_cookie: bool
+
+    @property
+    def cookie_max_age(self) -> int:
+        return 60 * self.access_token_expire_minutes
+
+    @classmethod
+    def from_env(cls) -> AuthSettings:
+        return cls(
+            google_client_id=os.getenv("GOOGLE_CLIENT_ID", ""),
+            google_client_secret=os.getenv("GOOGLE_CLIENT_SECRET", ""),
+            google_redirect_uri=os.getenv(
+                "GOOGLE_REDIRECT_URI", "http://localhost:8000/auth/callback"
+            ),
+            access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "720")),
+            auth_set_cookie_on_post=_env_bool("AUTH_SET_COOKIE_ON_POST", False),
+            cookie_secure=_env_bool("COOKIE_SECURE", False),
+            refresh_cookie_name=os.getenv("REFRESH_COOKIE_NAME", "__Host-deepme_rtok"),
+            secure_refresh_cookie=_env_bool("SECURE_COOKIE", True),
+        )
+
+
+AUTH_SETTINGS = AuthSettings.from_env()
@@ -5,7 +5,10 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
+
+from app.backend.core.token_cache import TokenCache
 
 # ── 설정 값 ─────────────────────────────────────
 SECRET_KEY: str | None = os.getenv("JWT_SECRET_KEY")
@@ -15,22 +18,31 @@ ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
 EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 # ───────────────────────────────────────────────
 
+_SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+_access_cache = TokenCache()
+
 def create_access_token(user_id: str, expires_delta: timedelta | None = None) -> str:
     """
     user_id(문자열)로 JWT Access Token을 발급한다.
     """
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=EXPIRE_MINUTES))
     payload: Dict[str, Any] = {"sub": user_id, "exp": expire, "typ": "access"}
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(payload, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 def verify_access_token(token: str) -> Dict[str, Any]:
     """
     유효한 Access Token이면 payload(dict)를 반환,
     서명 불일치·만료·type 오류가 나면 JWTError를 던진다.
     """
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    cached = _access_cache.get(token)
+    if cached is not None:
+        return cached
+    payload = jwt.decode(
+        token, _SECRET_KEY_BYTES, algorithms=[ALGORITHM], options={"require": ["exp", "sub"]}
+    )
     if payload.get("typ") != "access":
         raise JWTError("Invalid token type")
+    _access_cache.put(token, payload)
     return payload
 
 def decode_access_token(token: str):
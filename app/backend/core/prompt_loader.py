@@ -19,13 +19,17 @@ FALLBACK_TASK_PROMPT = (
 )
 
 
-def _load_system_prompt(path: Path) -> str:
+def _load_prompt(path: Path, fallback: str) -> str:
     try:
         txt = path.read_text(encoding="utf-8")
         return txt.strip()
     except FileNotFoundError:
-        logging.warning("[PromptLoader] system_prompt.txt not found. Using fallback.")
-        return FALLBACK_PROMPT
+        logging.warning("[PromptLoader] %s not found. Using fallback.", path.name)
+        return fallback
+
+
+def _load_system_prompt(path: Path) -> str:
+    return _load_prompt(path, FALLBACK_PROMPT)
 
 
 @lru_cache(maxsize=1)
@@ -40,12 +44,10 @@ TASK_PROMPT_PATH = _DEFAULT_TASK_PROMPT_PATH if _DEFAULT_TASK_PROMPT_PATH.exists
 
 @lru_cache(maxsize=1)
 def get_task_prompt() -> str:
-    try:
-        txt = TASK_PROMPT_PATH.read_text(encoding="utf-8")
-        return txt.strip()
-    except FileNotFoundError:
-        logging.warning("[PromptLoader] task_prompt.txt not found. Using fallback.")
-        return FALLBACK_TASK_PROMPT
+    return _load_prompt(TASK_PROMPT_PATH, FALLBACK_TASK_PROMPT)
 
 
+# import 시점에 두 프롬프트를 모두 읽어 캐시를 데워 둔다 — 요청 경로에서는 파일 I/O나
+# 파일 누락 처리 없이 캐시된 문자열만 돌려준다.
 SYSTEM_PROMPT = get_system_prompt()
+TASK_PROMPT = get_task_prompt()
@@ -0,0 +1,37 @@
+"""앱 전역 JSON 응답 클래스와 예외 핸들러.
+
+기본 응답을 orjson으로 직렬화하고 Content-Type에 charset을 처음부터 넣어,
+응답마다 헤더를 고치던 미들웨어 없이도 한글 응답이 깨지지 않게 한다.
+"""
+from __future__ import annotations
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class UTF8ORJSONResponse(ORJSONResponse):
+    media_type = "application/json; charset=utf-8"
+
+
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    # fastapi.exception_handlers.http_exception_handler와 같되 응답 클래스만 다르다.
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return UTF8ORJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+async def request_validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> UTF8ORJSONResponse:
+    return UTF8ORJSONResponse(
+        status_code=422,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
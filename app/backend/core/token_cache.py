@@ -0,0 +1,87 @@
+"""검증을 마친 JWT payload를 잠시 기억해 두는 TTL LRU 캐시.
+
+인증이 필요한 요청마다 HMAC 서명 검증 + JSON 파싱을 다시 하지 않도록,
+같은 토큰 문자열이 TTL 안에 다시 오면 이전 검증 결과를 돌려준다.
+원문 토큰은 보관하지 않고 blake2b 다이제스트를 키로 쓴다.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+
+TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", "10000"))
+TOKEN_CACHE_TTL_SEC = float(os.getenv("TOKEN_CACHE_TTL_SEC", "30"))
+
+
+def _cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+class TokenCache:
+    def __init__(
+        self,
+        maxsize: int = TOKEN_CACHE_MAXSIZE,
+        ttl_sec: float = TOKEN_CACHE_TTL_SEC,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl_sec = ttl_sec
+        # key -> (캐시 만료 시각(monotonic), payload)
+        self._entries: OrderedDict[bytes, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._keys_by_jti: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Dict[str, Any] | None:
+        if self._maxsize <= 0:
+            return None
+        key = _cache_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        # 캐시 TTL과 별개로 토큰 자체의 exp가 지났으면 검증을 다시 하게 한다.
+        exp = payload.get("exp")
+        if time.monotonic() >= expires_at or (exp is not None and exp <= time.time()):
+            with self._lock:
+                self._pop(key)
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return dict(payload)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        if self._maxsize <= 0:
+            return
+        key = _cache_key(token)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_sec, dict(payload))
+            self._entries.move_to_end(key)
+            jti = payload.get("jti")
+            if jti is not None:
+                self._keys_by_jti[str(jti)] = key
+            while len(self._entries) > self._maxsize:
+                self._pop(next(iter(self._entries)))
+
+    def discard_jti(self, jti: str) -> None:
+        with self._lock:
+            key = self._keys_by_jti.get(str(jti))
+            if key is not None:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_jti.clear()
+
+    def _pop(self, key: bytes) -> None:
+        # 호출하는 쪽에서 _lock을 잡고 있어야 한다.
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        jti = entry[1].get("jti")
+        if jti is not None and self._keys_by_jti.get(str(jti)) == key:
+            del self._keys_by_jti[str(jti)]
@@ -1,20 +1,21 @@
 from __future__ import annotations
 
+import base64
 import hashlib
-from datetime import datetime, timedelta, timezone
+import hmac
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, Tuple
 from uuid import UUID, uuid4
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
+import orjson
 import os
 
-# ← python-jose 사용
+from app.backend.core.auth_settings import AUTH_SETTINGS
+from app.backend.core.token_cache import TokenCache
 
-
-def _env_bool(key: str, default: bool) -> bool:
-    v = os.getenv(key)
-    if v is None:
-        return default
-    return v.lower() in ("1", "true", "yes", "on")
+# ← PyJWT 사용 (JWTError는 기존 호출부 호환용 별칭)
 
 
 # ---- 설정 ----
@@ -30,93 +31,176 @@ if not REFRESH_SECRET:
     raise RuntimeError("JWT_REFRESH_SECRET 환경변수가 설정되지 않았습니다.")
 REFRESH_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "21"))
 
-REFRESH_COOKIE_NAME = os.getenv("REFRESH_COOKIE_NAME", "__Host-deepme_rtok")
-SECURE_COOKIE = _env_bool("SECURE_COOKIE", True)
+_ACCESS_TTL_SEC = ACCESS_MIN * 60
+_REFRESH_TTL_SEC = REFRESH_DAYS * 86400
+
+REFRESH_COOKIE_NAME = AUTH_SETTINGS.refresh_cookie_name
+
+# 서명 키는 import 시 한 번만 bytes로 바꿔 둔다.
+_ACCESS_KEY = ACCESS_SECRET.encode("utf-8")
+_REFRESH_KEY = REFRESH_SECRET.encode("utf-8")
+
+# 검증 통과한 payload만 캐시한다 (실패는 매번 다시 검증).
+_access_cache = TokenCache()
+_refresh_cache = TokenCache()
 
 
 # ---- 공통 ----
-def _utcnow() -> datetime:
-    return datetime.now(tz=timezone.utc)
+def _now_ts() -> int:
+    # iat/exp는 정수 epoch 초라 datetime을 만들 필요 없이 time.time()으로 충분하다.
+    return int(time.time())
+
+
+def _b64url(raw: bytes) -> bytes:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# HS256 헤더는 항상 같으므로 base64url 인코딩 결과를 미리 만들어 둔다 (PyJWT와 같은 정렬/구분자).
+_HS256_HEADER_B64 = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}, option=orjson.OPT_SORT_KEYS))
 
 
-def _exp_in(minutes: int = 0, days: int = 0) -> datetime:
-    return _utcnow() + timedelta(minutes=minutes, days=days)
+def _sign_hs256(key: bytes, signing_input: bytes) -> bytes:
+    return hmac.new(key, signing_input, hashlib.sha256).digest()
 
 
-def _make_jwt(payload: Dict[str, Any], secret: str, exp: datetime) -> str:
+def _make_jwt_bytes(payload: Dict[str, Any], key: bytes, exp_ts: int) -> bytes:
     to_encode = payload.copy()
-    to_encode["iat"] = int(_utcnow().timestamp())
-    to_encode["exp"] = int(exp.timestamp())
-    return jwt.encode(to_encode, secret, algorithm=ALG)
+    to_encode["iat"] = _now_ts()
+    to_encode["exp"] = exp_ts
+    if ALG != "HS256":
+        return jwt.encode(to_encode, key, algorithm=ALG).encode("ascii")
+    # orjson은 공백 없는 UTF-8 bytes를 바로 돌려준다 (str → encode 단계 없음).
+    body = _b64url(orjson.dumps(to_encode))
+    signing_input = _HS256_HEADER_B64 + b"." + body
+    return signing_input + b"." + _b64url(_sign_hs256(key, signing_input))
+
+
+def _make_jwt(payload: Dict[str, Any], key: bytes, exp_ts: int) -> str:
+    return _make_jwt_bytes(payload, key, exp_ts).decode("ascii")
+
+
+_ACCESS_REQUIRED = ["exp", "iat", "sub"]
+_REFRESH_REQUIRED = ["exp", "iat", "sub", "jti"]
+
+
+class _OrjsonPyJWT(jwt.PyJWT):
+    """payload JSON 파싱만 orjson으로 바꾼 PyJWT (서명/클레임 검증은 그대로)."""
+
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
 
 
-def _decode(token: str, secret: str) -> Dict[str, Any]:
-    # jose.jwt.decode는 검증 실패 시 jose.exceptions.JWTError를 던짐
-    return jwt.decode(token, secret, algorithms=[ALG])
+_pyjwt = _OrjsonPyJWT()
+
+
+def _decode(token: str, key: bytes, required: list[str]) -> Dict[str, Any]:
+    # 서명/만료 검증 실패나 필수 클레임 누락 시 jwt.InvalidTokenError(=JWTError)를 던짐
+    return _pyjwt.decode(token, key, algorithms=[ALG], options={"require": required})
 
 
 def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+def token_fingerprint(s: str | bytes) -> str:
+    """DB에 저장하는 RT 지문. 짧은 입력에서 sha256보다 빠른 blake2b (hex 64자, 컬럼 폭 동일)."""
+    data = s if isinstance(s, bytes) else s.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def token_fingerprint_matches(stored: str, token: str) -> bool:
+    # 배포 전에 sha256으로 저장된 RT는 만료(REFRESH_DAYS)될 때까지 그대로 받아 준다.
+    data = token.encode("utf-8")
+    if hmac.compare_digest(stored, token_fingerprint(data)):
+        return True
+    return hmac.compare_digest(stored, hashlib.sha256(data).hexdigest())
+
+
 # ---- Access Token ----
 def create_access_token(sub: UUID, extra: Dict[str, Any] | None = None) -> str:
     payload = {"sub": str(sub), "typ": "access"}
     if extra:
         payload.update(extra)
-    return _make_jwt(payload, ACCESS_SECRET, _exp_in(minutes=ACCESS_MIN))
+    return _make_jwt(payload, _ACCESS_KEY, _now_ts() + _ACCESS_TTL_SEC)
 
 
 def verify_access_token(token: str) -> Dict[str, Any]:
-    payload = _decode(token, ACCESS_SECRET)
+    cached = _access_cache.get(token)
+    if cached is not None:
+        return cached
+    payload = _decode(token, _ACCESS_KEY, _ACCESS_REQUIRED)
     if payload.get("typ") != "access":
-        from jose.exceptions import JWTError
         raise JWTError("Invalid token type")
+    _access_cache.put(token, payload)
     return payload
 
 
 # ---- Refresh Token (회전 전제) ----
-def new_refresh_jti() -> str:
-    return str(uuid4())
+def new_refresh_jti() -> UUID:
+    return uuid4()
+
+
+def _make_refresh_token(sub: UUID, jti: UUID) -> Tuple[bytes, datetime]:
+    exp_ts = _now_ts() + _REFRESH_TTL_SEC
+    payload = {"sub": str(sub), "jti": str(jti), "typ": "refresh"}
+    token = _make_jwt_bytes(payload, _REFRESH_KEY, exp_ts)
+    # datetime 변환은 DB에 저장할 expires_at에서만 한다.
+    return token, datetime.fromtimestamp(exp_ts, tz=timezone.utc)
 
 
-def create_refresh_token(sub: UUID, jti: str) -> Tuple[str, datetime]:
-    exp = _exp_in(days=REFRESH_DAYS)
-    payload = {"sub": str(sub), "jti": jti, "typ": "refresh"}
-    token = _make_jwt(payload, REFRESH_SECRET, exp)
-    return token, exp
+def create_refresh_token(sub: UUID, jti: UUID) -> Tuple[str, datetime]:
+    token, exp = _make_refresh_token(sub, jti)
+    return token.decode("ascii"), exp
+
+
+def create_refresh_token_with_hash(sub: UUID, jti: UUID) -> Tuple[str, str, datetime]:
+    """RT 발급 + DB 저장용 지문을 한 번에. 서명 직후의 bytes를 그대로 해시해 str 재인코딩을 피한다."""
+    token, exp = _make_refresh_token(sub, jti)
+    return token.decode("ascii"), token_fingerprint(token), exp
 
 
 def verify_refresh_token(token: str) -> Dict[str, Any]:
-    payload = _decode(token, REFRESH_SECRET)
+    cached = _refresh_cache.get(token)
+    if cached is not None:
+        return cached
+    payload = _decode(token, _REFRESH_KEY, _REFRESH_REQUIRED)
     if payload.get("typ") != "refresh":
-        from jose.exceptions import JWTError
         raise JWTError("Invalid token type")
-    required = ("sub", "jti", "exp")
-    for k in required:
-        if k not in payload:
-            from jose.exceptions import JWTError
-            raise JWTError(f"Missing {k}")
+    _refresh_cache.put(token, payload)
     return payload
 
 
+def clear_token_cache(jti: UUID | str) -> None:
+    """폐기(회전/로그아웃)된 RT를 캐시에서 뺀다. 유효성의 최종 판단은 DB 행이 한다."""
+    _refresh_cache.discard_jti(str(jti))
+
+
 # ---- 쿠키 ----
+# 속성은 고정이라 Set-Cookie 헤더를 import 시 만들어 두고 토큰만 끼워 넣는다
+# (Starlette set_cookie의 SimpleCookie 직렬화를 매 로그인마다 하지 않는다).
+# 개발에서 http라면 .env에서 SECURE_COOKIE=false 설정 필요
+_RT_COOKIE_SECURE = "; Secure" if AUTH_SETTINGS.secure_refresh_cookie else ""
+_RT_COOKIE_FMT = f"{REFRESH_COOKIE_NAME}=%s; HttpOnly; Path=/; SameSite=lax{_RT_COOKIE_SECURE}"
+# __Host- 쿠키는 Secure 없이 덮어쓸 수 없어서 삭제 헤더에도 같은 Secure 속성을 붙인다.
+_RT_COOKIE_CLEAR = (
+    f'{REFRESH_COOKIE_NAME}=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; Max-Age=0; '
+    f"HttpOnly; Path=/; SameSite=lax{_RT_COOKIE_SECURE}"
+).encode("latin-1")
+
+
 def set_refresh_cookie(response, token: str):
-    # 개발에서 http라면 .env에서 SECURE_COOKIE=false 설정 필요
-    response.set_cookie(
-        key=REFRESH_COOKIE_NAME,
-        value=token,
-        httponly=True,
-        secure=SECURE_COOKIE,
-        path="/",
-    )
+    response.raw_headers.append((b"set-cookie", (_RT_COOKIE_FMT % token).encode("latin-1")))
 
 
 def clear_refresh_cookie(response):
-    response.delete_cookie(
-        key=REFRESH_COOKIE_NAME,
-        path="/",
-    )
+    response.raw_headers.append((b"set-cookie", _RT_COOKIE_CLEAR))
+
 
 def decode_access_token(token: str):
     """verify_access_token 과 동일 기능. 기존 코드 호환용."""
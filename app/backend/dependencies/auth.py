@@ -33,6 +33,9 @@ def get_current_user_optional(
     request: Request, token: str | None = Depends(oauth2_optional_scheme)
 ):
     """Lenient auth dependency; returns sub when valid, else None."""
+    # Anonymous fast path: no bearer token and no access_token cookie.
+    if token is None and "access_token" not in request.cookies:
+        return None
     jwt_token = _extract_jwt(request, token)
     if not jwt_token:
         return None
@@ -1,15 +1,24 @@
 # app/main.py
 import os
 import logging
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 from slowapi.errors import RateLimitExceeded
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.backend.core.logging_config import setup_logging
 from app.db.session import get_engine, ANALYZE_REQUIRED_TABLES
 from app.db.health import check_db_tables, health_db_response
 from app.backend.core.rate_limit import limiter as rate_limiter, RATELIMIT_ENABLED
+from app.backend.core.responses import (
+    UTF8ORJSONResponse,
+    http_exception_handler,
+    request_validation_exception_handler,
+)
 
 # 모델 모듈 임포트(테이블 등록 보장용)
 from app.backend.models import emotion as _m_emotion  # noqa: F401
@@ -28,12 +37,15 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="DEEPME Backend",
     version=os.getenv("APP_VERSION", "0.1.0"),
+    default_response_class=UTF8ORJSONResponse,
 )
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
 
 # Rate Limiting
 app.state.limiter = rate_limiter
 if RATELIMIT_ENABLED:
-    app.add_exception_handler(RateLimitExceeded, lambda request, exc: JSONResponse({"detail": "rate_limit_exceeded"}, status_code=429))
+    app.add_exception_handler(RateLimitExceeded, lambda request, exc: UTF8ORJSONResponse({"detail": "rate_limit_exceeded"}, status_code=429))
 
 # CORS
 _default_origins = "https://deep-me-v1.onrender.com,http://localhost:3000,http://localhost:5173"
@@ -48,6 +60,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 목록 API의 keyset 페이지네이션 커서를 브라우저 클라이언트가 읽을 수 있게 노출
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -61,20 +75,30 @@ app.include_router(task.router)
 app.include_router(deploy_webhook.router)
 
 
-@app.middleware("http")
-async def add_charset_for_json(request: Request, call_next) -> Response:
-    resp = await call_next(request)
-    ct = resp.headers.get("content-type", "")
-    if ct.startswith("application/json") and "charset" not in ct.lower():
-        resp.headers["content-type"] = "application/json; charset=utf-8"
-    return resp
-
-
 @app.on_event("startup")
 def validate_required_tables() -> None:
     check_db_tables(get_engine(), ANALYZE_REQUIRED_TABLES, "core+analyze")
 
 
+@app.on_event("startup")
+async def raise_threadpool_limit() -> None:
+    # sync 핸들러/의존성(Session 기반 DB 작업, 동기 LLM 호출)은 anyio 스레드풀에서 돈다.
+    # 기본 40개로는 LLM 응답을 기다리는 요청이 쌓이면 나머지 요청이 줄을 선다.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_MAX_WORKERS", "100"))
+
+
+@app.on_event("startup")
+def warm_up_orm_mappers() -> None:
+    # relationship 해석/매퍼 컴파일을 첫 요청이 아니라 기동 시점에 끝내 둔다.
+    configure_mappers()
+
+
+@app.on_event("shutdown")
+async def close_shared_http_clients() -> None:
+    await auth.close_google_http()
+
+
 
 @app.get("/health")
 def health_app():
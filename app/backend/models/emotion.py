@@ -1,16 +1,28 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint
 from typing import Optional, List
 from uuid import UUID, uuid4
 from datetime import datetime
 
+from app.db.functions import utcnow
+
 # 1. 감정 세션 모델
 class EmotionSession(SQLModel, table=True):
     __tablename__ = "emotionsession"
+    __table_args__ = (
+        # 목록/진행 중 세션 조회: user_id로 거르고 (started_at, session_id) 역순으로 읽는다.
+        Index("ix_emotionsession_user_started", "user_id", "started_at", "session_id"),
+    )
+    # INSERT ... RETURNING으로 서버가 채운 started_at을 flush 시점에 바로 받는다.
+    __mapper_args__ = {"eager_defaults": True}
 
     session_id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key="user.user_id")
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    # 값은 DB가 채운다 (server_default). 명시적으로 넘기면 그 값을 쓴다.
+    started_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
     ended_at: Optional[datetime] = None
 
     emotion_label: Optional[str] = None
@@ -29,6 +41,7 @@ class EmotionStep(SQLModel, table=True):
         UniqueConstraint("session_id", "step_order", name="uq_emotionstep_session_order"),
         Index("ix_emotionstep_session_order", "session_id", "step_order"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     step_id: UUID = Field(default_factory=uuid4, primary_key=True)
     session_id: UUID = Field(
@@ -42,7 +55,10 @@ class EmotionStep(SQLModel, table=True):
     step_type: str
     user_input: str
     gpt_response: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
 
     insight_tag: Optional[str] = None
 
@@ -4,24 +4,42 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import Column, DateTime, Index, text
 from sqlmodel import SQLModel, Field
 
+from app.db.functions import utcnow
+
 
 class RefreshToken(SQLModel, table=True):
     """
     회전(rotation)과 재사용 탐지(reuse detection)를 위한 RT 레코드.
     - jti: 토큰 고유 식별자(JWT 'jti' 또는 자체 UUID)
-    - token_hash: DB 유출 대비 원문 토큰 해시(sha256)
+    - token_hash: DB 유출 대비 원문 토큰 해시(blake2b-256 hex, 이전 행은 sha256)
     - replaced_by: 새 RT의 jti (회전 체인)
     """
-    jti: str = Field(primary_key=True)
+    __table_args__ = (
+        # 로그아웃/재사용 탐지는 살아 있는(revoked_at IS NULL) 행만 본다.
+        Index(
+            "ix_refreshtoken_user_active",
+            "user_id",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    jti: UUID = Field(primary_key=True)
     user_id: UUID = Field(index=True, foreign_key="user.user_id")
     token_hash: str = Field(nullable=False)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # 값은 DB가 채운다 (server_default). expires_at은 JWT exp와 같아야 해서 앱이 넣는다.
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
     expires_at: datetime
     revoked_at: Optional[datetime] = None
-    replaced_by: Optional[str] = None
+    replaced_by: Optional[UUID] = None
 
     ip: Optional[str] = None
     user_agent: Optional[str] = None
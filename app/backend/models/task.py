@@ -1,13 +1,22 @@
+from sqlalchemy import Column, DateTime
 from sqlmodel import SQLModel, Field
 from uuid import UUID, uuid4
 from datetime import datetime
 from typing import Optional
 
+from app.db.functions import utcnow
+
 class Task(SQLModel, table=True):
+    __mapper_args__ = {"eager_defaults": True}
+
     task_id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key="user.user_id")
     title: str
     description: Optional[str] = None
     is_completed: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # 값은 DB가 채운다 (server_default).
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
     completed_at: Optional[datetime] = None
@@ -1,14 +1,23 @@
+from sqlalchemy import Column, DateTime
 from sqlmodel import SQLModel, Field
 from uuid import UUID, uuid4
 from datetime import datetime
 from typing import Optional
 
+from app.db.functions import utcnow
+
 
 class User(SQLModel, table=True):
+    __mapper_args__ = {"eager_defaults": True}
+
     user_id: UUID = Field(default_factory=uuid4, primary_key=True)  # 이름 변경됨
     name: str
     email: str = Field(index=True, unique=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # 값은 DB가 채운다 (server_default).
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=utcnow()),
+    )
     __tablename__ = "user"
 
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import os
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 from uuid import UUID
 from urllib.parse import urlencode
@@ -15,12 +16,12 @@ from sqlmodel import Session, select
 from app.db.session import get_session
 from app.backend.models.user import User
 from app.backend.models.refresh_token import RefreshToken
-from app.backend.services.auth_service import refresh_tokens
+from app.backend.services.auth_service import refresh_tokens, revoke_user_refresh_tokens
+from app.backend.core.auth_settings import AUTH_SETTINGS
 from app.backend.core.tokens import (
     create_access_token,
-    create_refresh_token,
+    create_refresh_token_with_hash,
     new_refresh_jti,
-    sha256_hex,
     set_refresh_cookie,
     clear_refresh_cookie,
 )
@@ -35,15 +36,8 @@ auth_router = APIRouter()
 # ──────────────────────────────────────────────────────────────────────────────
 # 환경변수 & 상수
 # ──────────────────────────────────────────────────────────────────────────────
-REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8000/auth/callback")
-
-# Access Token TTL(분) — app/core/tokens.create_access_token은 .env의 ACCESS_TOKEN_EXPIRE_MINUTES를 사용
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "720"))
-
-# AT를 쿠키로도 내려줄지(웹 혼용 환경에서만 권장; 기본 False)
-AUTH_SET_COOKIE_ON_POST = os.getenv("AUTH_SET_COOKIE_ON_POST", "false").lower() == "true"
-COOKIE_SECURE = os.getenv("COOKIE_SECURE", "false").lower() == "true"  # 배포시 true 권장
-COOKIE_MAX_AGE = 60 * ACCESS_TOKEN_EXPIRE_MINUTES
+# OAuth 클라이언트·Access Token TTL(분)·쿠키 플래그는 AUTH_SETTINGS가 import 시 한 번만 읽는다
+# (app/core/tokens.create_access_token은 .env의 ACCESS_TOKEN_EXPIRE_MINUTES를 사용)
 
 # 구글 엔드포인트
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
@@ -51,9 +45,26 @@ GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_TOKENINFO_URL = "https://oauth2.googleapis.com/tokeninfo"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
 
+# 로그인마다 AsyncClient를 새로 만들면 구글과 TLS 핸드셰이크를 매번 다시 한다.
+# 프로세스당 하나를 재사용하고 앱 종료 시 close_google_http()로 닫는다.
+_GOOGLE_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32)
+_google_http: httpx.AsyncClient | None = None
+
+def _get_google_http() -> httpx.AsyncClient:
+    global _google_http
+    if _google_http is None or _google_http.is_closed:
+        _google_http = httpx.AsyncClient(timeout=10.0, limits=_GOOGLE_HTTP_LIMITS)
+    return _google_http
+
+async def close_google_http() -> None:
+    global _google_http
+    if _google_http is not None:
+        await _google_http.aclose()
+        _google_http = None
+
 def _get_google_oauth_config() -> tuple[str, str]:
-    client_id = os.getenv("GOOGLE_CLIENT_ID")
-    client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
+    client_id = AUTH_SETTINGS.google_client_id
+    client_secret = AUTH_SETTINGS.google_client_secret
     if not client_id or not client_secret:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -90,30 +101,67 @@ def _set_access_cookie_if_enabled(response: Response, jwt_token: str) -> None:
     Access Token을 쿠키로도 내려야 하는 환경(웹)에서만 사용.
     기본값은 False이며, 보안상 AT는 메모리 보관 권장.
     """
-    if response is not None and AUTH_SET_COOKIE_ON_POST:
+    if response is not None and AUTH_SETTINGS.auth_set_cookie_on_post:
         response.set_cookie(
             key="access_token",
             value=jwt_token,
             httponly=True,
-            secure=COOKIE_SECURE,
-            max_age=COOKIE_MAX_AGE,
+            secure=AUTH_SETTINGS.cookie_secure,
+            max_age=AUTH_SETTINGS.cookie_max_age,
             path="/",
         )
 
 def _build_auth_response(user: User, access_token: str) -> AuthTokenModel:
     return AuthTokenModel(
         access_token=access_token,
-        expires_in=COOKIE_MAX_AGE,
+        expires_in=AUTH_SETTINGS.cookie_max_age,
         user={"user_id": str(user.user_id), "name": user.name, "email": user.email},
     )
 
+# 재로그인하는 사용자는 email → user_id를 기억해 두고 PK 조회(db.get)로 끝낸다.
+_EMAIL_TO_UID_TTL_SEC = 300.0
+_EMAIL_TO_UID_MAXSIZE = 4096
+_email_to_uid: OrderedDict[str, tuple[float, UUID]] = OrderedDict()
+_email_to_uid_lock = threading.Lock()
+
+def _cached_user_id(email: str) -> UUID | None:
+    with _email_to_uid_lock:
+        entry = _email_to_uid.get(email)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _email_to_uid[email]
+            return None
+        _email_to_uid.move_to_end(email)
+        return entry[1]
+
+def _remember_user_id(email: str, user_id: UUID) -> None:
+    with _email_to_uid_lock:
+        _email_to_uid[email] = (time.monotonic() + _EMAIL_TO_UID_TTL_SEC, user_id)
+        _email_to_uid.move_to_end(email)
+        while len(_email_to_uid) > _EMAIL_TO_UID_MAXSIZE:
+            _email_to_uid.popitem(last=False)
+
+def forget_user_email(email: str) -> None:
+    """사용자 삭제/이메일 변경 시 호출해 캐시된 매핑을 버린다."""
+    with _email_to_uid_lock:
+        _email_to_uid.pop(email, None)
+
 def _get_or_create_user(db: Session, *, email: str, name: str | None) -> User:
+    cached_uid = _cached_user_id(email)
+    if cached_uid is not None:
+        user = db.get(User, cached_uid)
+        if user is not None and user.email == email:
+            return user
+        forget_user_email(email)
+
     user = db.exec(select(User).where(User.email == email)).first()
     if not user:
+        # 커밋은 issue_tokens_for_user가 RT INSERT와 함께 한 번만 한다 (로그인당 1 트랜잭션).
         user = User(name=name or "User", email=email)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        db.flush()
+    _remember_user_id(email, user.user_id)
     return user
 
 async def _verify_id_token_and_extract(
@@ -162,19 +210,20 @@ def issue_tokens_for_user(
 
     # 2) Refresh Token (회전 전제)
     jti = new_refresh_jti()
-    refresh_token, exp = create_refresh_token(user.user_id, jti)
+    refresh_token, refresh_hash, exp = create_refresh_token_with_hash(user.user_id, jti)
 
     # 3) DB 저장(원문은 저장하지 않고 해시만 저장)
     db.add(
         RefreshToken(
             jti=jti,
             user_id=user.user_id,
-            token_hash=sha256_hex(refresh_token),
+            token_hash=refresh_hash,
             expires_at=exp,
             ip=ip,
             user_agent=user_agent,
         )
     )
+    # 신규 사용자 INSERT(_get_or_create_user의 flush)도 이 커밋에 함께 확정된다.
     db.commit()
 
     # 4) RT 쿠키 세팅 (HttpOnly/Secure/SameSite는 app/core/tokens에서 처리)
@@ -183,7 +232,7 @@ def issue_tokens_for_user(
     return {
         "token_type": "bearer",
         "access_token": access_token,
-        "expires_in": COOKIE_MAX_AGE,
+        "expires_in": AUTH_SETTINGS.cookie_max_age,
         "user_id": str(user.user_id),
     }
 
@@ -195,7 +244,7 @@ def login_via_google():
     google_client_id, _google_client_secret = _get_google_oauth_config()
     params = {
         "client_id": google_client_id,
-        "redirect_uri": REDIRECT_URI,
+        "redirect_uri": AUTH_SETTINGS.google_redirect_uri,
         "response_type": "code",
         "scope": "openid email profile",
     }
@@ -210,28 +259,28 @@ async def google_auth_callback(
 ):
     # code → access_token 교환
     google_client_id, google_client_secret = _get_google_oauth_config()
-    async with httpx.AsyncClient() as http:
-        token_res = await http.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "code": code,
-                "client_id": google_client_id,
-                "client_secret": google_client_secret,
-                "redirect_uri": REDIRECT_URI,
-                "grant_type": "authorization_code",
-            },
-            timeout=10.0,
-        )
-        if token_res.status_code != 200:
-            raise HTTPException(status_code=400, detail="토큰 요청 실패")
-        token_json = token_res.json()
+    http = _get_google_http()
+    token_res = await http.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": google_client_id,
+            "client_secret": google_client_secret,
+            "redirect_uri": AUTH_SETTINGS.google_redirect_uri,
+            "grant_type": "authorization_code",
+        },
+        timeout=10.0,
+    )
+    if token_res.status_code != 200:
+        raise HTTPException(status_code=400, detail="토큰 요청 실패")
+    token_json = token_res.json()
 
-        g_access_token = token_json.get("access_token")
-        if not g_access_token:
-            raise HTTPException(status_code=400, detail="access_token 누락됨")
+    g_access_token = token_json.get("access_token")
+    if not g_access_token:
+        raise HTTPException(status_code=400, detail="access_token 누락됨")
 
-        # userinfo 조회
-        email, name = await _fetch_userinfo_with_access_token(http, g_access_token)
+    # userinfo 조회
+    email, name = await _fetch_userinfo_with_access_token(http, g_access_token)
 
     user = _get_or_create_user(db, email=email, name=name)
 
@@ -260,12 +309,12 @@ async def auth_with_google(
     db: Session = Depends(get_session),
 ):
     google_client_id, _google_client_secret = _get_google_oauth_config()
-    async with httpx.AsyncClient() as http:
-        email, name = await _verify_id_token_and_extract(
-            http,
-            body.id_token,
-            google_client_id=google_client_id,
-        )
+    http = _get_google_http()
+    email, name = await _verify_id_token_and_extract(
+        http,
+        body.id_token,
+        google_client_id=google_client_id,
+    )
     user = _get_or_create_user(db, email=email, name=name)
 
     meta = issue_tokens_for_user(
@@ -286,8 +335,8 @@ async def auth_with_google_access(
     response: Response,
     db: Session = Depends(get_session),
 ):
-    async with httpx.AsyncClient() as http:
-        email, name = await _fetch_userinfo_with_access_token(http, body.access_token)
+    http = _get_google_http()
+    email, name = await _fetch_userinfo_with_access_token(http, body.access_token)
     user = _get_or_create_user(db, email=email, name=name)
 
     meta = issue_tokens_for_user(
@@ -307,7 +356,7 @@ async def auth_with_google_access(
 def logout(
     response: Response,
     db: Session = Depends(get_session),
-    current_user: Optional[User] = Depends(get_current_user) if get_current_user else None,
+    current_user: Optional[str] = Depends(get_current_user) if get_current_user else None,
 ):
     """
     현재 사용자 모든 RT 무효화 + 쿠키 제거
@@ -317,13 +366,8 @@ def logout(
 
     # current_user가 없고 get_current_user가 없다면(개발 편의), 쿠키만 제거
     if current_user:
-        for row in db.exec(
-            select(RefreshToken).where(
-                RefreshToken.user_id == current_user.user_id,
-                RefreshToken.revoked_at.is_(None),
-            )
-        ):
-            row.revoked_at = datetime.utcnow()
+        # get_current_user는 토큰의 sub(user_id 문자열)를 돌려준다.
+        revoke_user_refresh_tokens(db, UUID(current_user))
         db.commit()
 
     clear_refresh_cookie(response)
@@ -349,8 +393,8 @@ async def refresh_token_endpoint(
         request=request,
         response=response,
         db=db,
-        set_access_cookie=AUTH_SET_COOKIE_ON_POST,
-        access_cookie_secure=COOKIE_SECURE,
-        access_cookie_max_age=COOKIE_MAX_AGE,
+        set_access_cookie=AUTH_SETTINGS.auth_set_cookie_on_post,
+        access_cookie_secure=AUTH_SETTINGS.cookie_secure,
+        access_cookie_max_age=AUTH_SETTINGS.cookie_max_age,
     )
     return RefreshResponse(**data)
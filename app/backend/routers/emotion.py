@@ -1,15 +1,21 @@
 # app/routers/emotion.py
-from datetime import datetime
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import logging
+from typing import Iterator, Optional
+from uuid import UUID, uuid4
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, literal, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from app.backend.core.prompt_loader import get_system_prompt, get_task_prompt
-from app.db.session import get_session
+from app.db.session import get_session, session_scope
 from app.backend.dependencies.auth import get_current_user_optional
 from app.backend.models.emotion import EmotionSession, EmotionStep
 from app.backend.services.close_policy import (
+    StreamingConfirmCloseFilter,
     extract_end_session_marker,
 )
 from app.backend.schemas.emotion import (
@@ -22,15 +28,20 @@ from app.backend.schemas.emotion import (
 )
 from app.backend.services.convo_policy import (
     ACTIVITY_STEP_TYPE,
-    _max_step_order,
     is_activity_turn,
 )
-from app.backend.services.llm_service import generate_noa_response
+from app.backend.services.llm_service import generate_noa_response, stream_noa_response
 from app.backend.services.ws_utils import transcript_rows_to_conversation
 from app.backend.services.web_test_user import resolve_emotion_user_id
 
+logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/emotion", tags=["Emotion"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# /steps/generate가 프롬프트에 싣는 최근 스텝 수 (user+assistant 약 20턴 = POLICY_MAX_TURNS 기본값)
+MAX_CONTEXT_STEPS = 40
+
 
 def _emotion_user_id(
     db: Session = Depends(get_session),
@@ -66,13 +77,26 @@ def get_active_session(
 
 @router.get("/sessions", response_model=list[EmotionSessionRead])
 def list_sessions(
+    response: Response,
     db: Session = Depends(get_session),
     emotion_user_id: UUID = Depends(_emotion_user_id),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: Optional[int] = Query(default=None, ge=0),
+    cursor: Optional[str] = Query(default=None),
 ):
     from app.analyze.models import AnalysisCard
-    from app.analyze.services.card_content import has_meaningful_content
+    from app.analyze.services.card_content import CONTENT_FIELDS, has_meaningful_content
+    from app.analyze.services.summaries import decode_cursor, encode_cursor
+
+    # (started_at, session_id) 내림차순 keyset 페이지네이션. offset은 구 클라이언트 호환용.
+    after = None
+    if cursor is not None:
+        if offset is not None:
+            raise HTTPException(status_code=400, detail="use either cursor or offset")
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid cursor")
 
     # 사용자 발화가 하나도 없는 빈 세션은 기록 리스트에 노출하지 않는다.
     has_user_step = (
@@ -95,24 +119,38 @@ def list_sessions(
         .where(EmotionSession.user_id == emotion_user_id)
         .where(has_user_step)
         .where(has_card | (EmotionSession.ended_at != None))  # noqa: E711
-        .order_by(EmotionSession.started_at.desc())
+        .order_by(EmotionSession.started_at.desc(), EmotionSession.session_id.desc())
         .limit(limit)
-        .offset(offset)
     )
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(EmotionSession.started_at, EmotionSession.session_id) < tuple_(*after)
+        )
+    if offset is not None:
+        stmt = stmt.offset(offset)
     sessions = db.exec(stmt).all()
 
+    # 빈 세션 필터링 전의 마지막 행 기준으로 커서를 잡아야 건너뛰는 행이 없다.
+    if len(sessions) == limit:
+        last = sessions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.started_at, last.session_id)
+
     # 카드가 존재하지만 내용이 완전히 비어있는 세션(수동 생성 API의 과거 버그로
     # 생성된 레거시 데이터 등)도 클릭 시 빈 화면이 되므로 함께 제외한다.
     session_ids = [s.session_id for s in sessions]
     if not session_ids:
         return sessions
+    # 내용 판정에 필요한 컬럼만 한 번의 IN 조회로 가져온다 (카드 ORM 객체를 만들지 않음).
     cards = db.exec(
-        select(AnalysisCard).where(AnalysisCard.session_id.in_(session_ids))
-    ).all()
+        select(
+            AnalysisCard.session_id,
+            *(getattr(AnalysisCard, name) for name in CONTENT_FIELDS),
+        ).where(AnalysisCard.session_id.in_(session_ids))
+    ).mappings().all()
     empty_card_session_ids = {
-        card.session_id
+        card["session_id"]
         for card in cards
-        if not has_meaningful_content(card.model_dump())
+        if not has_meaningful_content(card)
     }
     if not empty_card_session_ids:
         return sessions
@@ -120,7 +158,7 @@ def list_sessions(
 
 
 @router.get("/sessions/{session_id}", response_model=EmotionSessionRead)
-def get_session(
+def read_session(
     session_id: UUID,
     db: Session = Depends(get_session),
     emotion_user_id: UUID = Depends(_emotion_user_id),
@@ -133,24 +171,38 @@ def get_session(
 
 @router.get("/steps", response_model=list[EmotionStepRead])
 def list_steps(
+    response: Response,
     session_id: UUID = Query(...),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    offset: Optional[int] = Query(default=None, ge=0),
+    cursor: Optional[int] = Query(default=None, description="이전 페이지 마지막 step_order"),
     db: Session = Depends(get_session),
     emotion_user_id: UUID = Depends(_emotion_user_id),
 ):
-    sess = db.get(EmotionSession, session_id)
-    if not sess or sess.user_id != emotion_user_id:
-        raise HTTPException(status_code=404, detail="session not found")
-
+    if cursor is not None and offset is not None:
+        raise HTTPException(status_code=400, detail="use either cursor or offset")
+    # 소유권 확인을 join 조건에 넣어 스텝 조회 한 번으로 끝낸다.
     stmt = (
         select(EmotionStep)
+        .join(EmotionSession, EmotionSession.session_id == EmotionStep.session_id)
         .where(EmotionStep.session_id == session_id)
+        .where(EmotionSession.user_id == emotion_user_id)
         .order_by(EmotionStep.step_order)
         .limit(limit)
-        .offset(offset)
     )
-    return db.exec(stmt).all()
+    if cursor is not None:
+        stmt = stmt.where(EmotionStep.step_order > cursor)
+    if offset is not None:
+        stmt = stmt.offset(offset)
+    steps = db.exec(stmt).all()
+    if not steps:
+        # 결과가 비었을 때만 "남의/없는 세션(404)"과 "빈 페이지(200)"를 구분한다.
+        sess = db.get(EmotionSession, session_id)
+        if not sess or sess.user_id != emotion_user_id:
+            raise HTTPException(status_code=404, detail="session not found")
+    elif len(steps) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(steps[-1].step_order)
+    return steps
 
 
 @router.post("/sessions", response_model=EmotionSessionRead)
@@ -163,13 +215,16 @@ def create_emotion_session(
         raise HTTPException(status_code=403, detail="user_id mismatch")
 
     new_session = EmotionSession(
-        **session_data.dict(exclude={"user_id"}),
+        **session_data.dict(exclude={"user_id"}, exclude_none=True),
         user_id=emotion_user_id,
     )
     db.add(new_session)
+    # eager_defaults라 flush의 INSERT ... RETURNING이 started_at까지 채운다.
+    # commit 뒤 refresh로 한 번 더 SELECT하지 않도록 flush 직후에 직렬화한다.
+    db.flush()
+    out = EmotionSessionRead.model_validate(new_session)
     db.commit()
-    db.refresh(new_session)
-    return new_session
+    return out
 
 
 @router.post("/steps", response_model=EmotionStepRead)
@@ -178,76 +233,100 @@ def create_emotion_step(
     db: Session = Depends(get_session),
     emotion_user_id: UUID = Depends(_emotion_user_id),
 ):
-    sess = db.get(EmotionSession, step.session_id)
-    if not sess or sess.user_id != emotion_user_id:
-        raise HTTPException(status_code=404, detail="session not found")
-
-    new_step = EmotionStep(
-        session_id=step.session_id,
-        step_order=step.step_order,
-        step_type=step.step_type,
-        user_input=step.user_input,
-        gpt_response=step.gpt_response,
-        created_at=datetime.utcnow(),
-        insight_tag=step.insight_tag,
+    # 소유권 확인을 INSERT ... SELECT ... WHERE EXISTS에 넣어 한 번의 왕복으로 처리한다.
+    # 남의/없는 세션이면 한 행도 들어가지 않고 RETURNING 결과가 비어 404가 된다.
+    owned = (
+        select(EmotionSession.session_id)
+        .where(EmotionSession.session_id == step.session_id)
+        .where(EmotionSession.user_id == emotion_user_id)
+        .exists()
+    )
+    values = {
+        "step_id": uuid4(),
+        "session_id": step.session_id,
+        "step_order": step.step_order,
+        "step_type": step.step_type,
+        "user_input": step.user_input,
+        "gpt_response": step.gpt_response,
+        "insight_tag": step.insight_tag,
+    }
+    columns = EmotionStep.__table__.c
+    stmt = (
+        insert(EmotionStep)
+        .from_select(
+            list(values),
+            select(*(literal(v, columns[k].type) for k, v in values.items())).where(owned),
+        )
+        .returning(*columns)
     )
-    db.add(new_step)
+    row = db.exec(stmt).mappings().first()
+    if row is None:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="session not found")
+    out = EmotionStepRead.model_validate(row)
     db.commit()
-    db.refresh(new_step)
-    return new_step
+    return out
 
 
-@router.post("/steps/generate", response_model=EmotionStepRead)
-def generate_emotion_step(
+def _prepare_generation(
+    db: Session,
     input_data: EmotionStepGenerateInput,
-    db: Session = Depends(get_session),
-    emotion_user_id: UUID = Depends(_emotion_user_id),
-):
+    emotion_user_id: UUID,
+) -> dict:
+    """LLM 호출 전 단계: 소유권 확인, 최근 스텝 로드, 프롬프트/대화 조립."""
     if input_data.session_id is None:
         raise HTTPException(status_code=400, detail="session_id is required")
 
-    sess = db.get(EmotionSession, input_data.session_id)
-    if not sess or sess.user_id != emotion_user_id:
+    # 세션 존재/소유 확인과 최근 스텝 조회를 outer join 한 번으로 처리한다.
+    # (session_id, step_order) 인덱스를 역순으로 타서 최근 MAX_CONTEXT_STEPS개만 가져온 뒤 뒤집는다.
+    rows = db.exec(
+        select(EmotionSession, EmotionStep)
+        .outerjoin(EmotionStep, EmotionStep.session_id == EmotionSession.session_id)
+        .where(EmotionSession.session_id == input_data.session_id)
+        .order_by(EmotionStep.step_order.desc())
+        .limit(MAX_CONTEXT_STEPS)
+    ).all()
+    if not rows or rows[0][0].user_id != emotion_user_id:
         raise HTTPException(status_code=404, detail="session not found")
+    rows.reverse()
 
     # ?”’ ?œë„ ì´ˆê³¼ ê°€??(LLM ?¸ì¶œ ?„ì— ì°¨ë‹¨)
-    recent_all = db.exec(
-        select(EmotionStep)
-        .where(EmotionStep.session_id == input_data.session_id)
-        .order_by(EmotionStep.step_order)
-    ).all()
+    recent_all = [step for _sess, step in rows if step is not None]
 
     # ?œìŠ¤???„ë¡¬?„íŠ¸ ì¡°ë¦½
-    system_prompt = get_system_prompt()
     activity_turn = is_activity_turn(
         user_text=input_data.user_input,
         db=db,
         session_id=input_data.session_id,
         steps=recent_all,
     )
-    task_prompt = get_task_prompt() if activity_turn else None
-
-    # LLM ?‘ë‹µ ?ì„±
-    convo = transcript_rows_to_conversation(recent_all) + [("user", input_data.user_input)]
-    response = generate_noa_response(
-        system_prompt=system_prompt,
-        task_prompt=task_prompt,
-        conversation=convo,
-        temperature=input_data.temperature,
-        max_tokens=input_data.max_completion_tokens,
-    )
-    response, _end_by_token = extract_end_session_marker(response)
 
     # ?¤í… ?€???œë²„?ì„œ step_order ë¶€?? ??WebSocketê³??™ì¼???œì„œ(user?’assistant?’activity)
-    current_max_order = _max_step_order(db, input_data.session_id)
-    next_order = current_max_order + 1
+    # recent_all의 마지막이 가장 큰 step_order라 MAX(step_order)를 다시 조회하지 않는다.
+    current_max_order = recent_all[-1].step_order if recent_all else 0
+    return {
+        "system_prompt": get_system_prompt(),
+        "task_prompt": get_task_prompt() if activity_turn else None,
+        "conversation": transcript_rows_to_conversation(recent_all, input_data.user_input),
+        "activity_turn": activity_turn,
+        "next_order": current_max_order + 1,
+    }
+
+
+def _save_generated_turn(
+    db: Session,
+    input_data: EmotionStepGenerateInput,
+    response: str,
+    ctx: dict,
+) -> EmotionStepRead:
+    """LLM 응답을 받은 뒤 user→assistant(→activity) 스텝을 저장하고 assistant 스텝을 돌려준다."""
+    next_order = ctx["next_order"]
     user_step = EmotionStep(
         session_id=input_data.session_id,
         step_order=next_order,
         step_type="user",
         user_input=input_data.user_input,
         gpt_response="",
-        created_at=datetime.utcnow(),
         insight_tag=input_data.insight_tag,
     )
     assistant_step = EmotionStep(
@@ -256,25 +335,117 @@ def generate_emotion_step(
         step_type="assistant",
         user_input="",
         gpt_response=response,
-        created_at=datetime.utcnow(),
         insight_tag=None,
     )
-    db.add(user_step)
-    db.add(assistant_step)
+    # 세 행 모두 PK(uuid4)를 앱에서 채우므로 flush 때 INSERT 한 번(executemany)으로 묶인다.
+    new_steps = [user_step, assistant_step]
 
-    if activity_turn:
+    if ctx["activity_turn"]:
         marker = EmotionStep(
             session_id=input_data.session_id,
             step_order=next_order + 2,
             step_type=ACTIVITY_STEP_TYPE,
             user_input="",
             gpt_response="",
-            created_at=datetime.utcnow(),
             insight_tag=None,
         )
-        db.add(marker)
+        new_steps.append(marker)
+    db.add_all(new_steps)
 
     # ì¢…ë£Œ ?´ì´ë©??¸ì…˜ ì¢…ë£Œ ?€?„ìŠ¤?¬í”„ ?¤ì •
+    try:
+        db.flush()
+    except IntegrityError:
+        # LLM 응답을 기다리는 동안 같은 세션에 다른 요청이 먼저 스텝을 저장한 경우
+        db.rollback()
+        raise HTTPException(status_code=409, detail="step order conflict")
+    # commit 뒤 refresh(SELECT) 대신 flush 직후에 직렬화한다.
+    out = EmotionStepRead.model_validate(assistant_step)
     db.commit()
-    db.refresh(assistant_step)
-    return assistant_step
+    return out
+
+
+@router.post("/steps/generate", response_model=EmotionStepRead)
+def generate_emotion_step(
+    input_data: EmotionStepGenerateInput,
+    db: Session = Depends(get_session),
+    emotion_user_id: UUID = Depends(_emotion_user_id),
+):
+    ctx = _prepare_generation(db, input_data, emotion_user_id)
+    # LLM 응답을 기다리는 수 초 동안 풀 커넥션을 붙잡지 않도록 여기서 반납한다.
+    # 읽어 둔 객체는 detach될 뿐 값은 남고, 아래 저장은 같은 Session이 새 커넥션으로 처리한다.
+    db.close()
+
+    # LLM ?‘ë‹µ ?ì„±
+    response = generate_noa_response(
+        system_prompt=ctx["system_prompt"],
+        task_prompt=ctx["task_prompt"],
+        conversation=ctx["conversation"],
+        temperature=input_data.temperature,
+        max_tokens=input_data.max_completion_tokens,
+    )
+    response, _end_by_token = extract_end_session_marker(response)
+    return _save_generated_turn(db, input_data, response, ctx)
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return b"event: " + event.encode("ascii") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def _stream_generation(input_data: EmotionStepGenerateInput, ctx: dict) -> Iterator[bytes]:
+    close_filter = StreamingConfirmCloseFilter()
+    parts: list[str] = []
+    try:
+        for piece in stream_noa_response(
+            system_prompt=ctx["system_prompt"],
+            task_prompt=ctx["task_prompt"],
+            conversation=ctx["conversation"],
+            temperature=input_data.temperature,
+            max_tokens=input_data.max_completion_tokens,
+        ):
+            emit = close_filter.feed(piece)
+            if emit:
+                parts.append(emit)
+                yield _sse("delta", {"text": emit})
+            if close_filter.end_detected:
+                break
+        tail = close_filter.flush()
+        if tail:
+            parts.append(tail)
+            yield _sse("delta", {"text": tail})
+    except Exception:
+        # 헤더와 일부 delta가 이미 나간 뒤라 상태 코드로 알릴 수 없다.
+        # WS 경로와 같이 error 이벤트로 알리고, 잘린 응답은 저장하지 않는다.
+        logger.exception("SSE LLM stream failed | session_id=%s", input_data.session_id)
+        yield _sse("error", {"detail": "stream_failed", "turn_dropped": True})
+        return
+
+    response = "".join(parts)
+    if not response.strip():
+        yield _sse("error", {"detail": "empty_assistant_response", "turn_dropped": True})
+        return
+
+    # 스트림이 끝난 뒤에 저장한다. 요청 Session은 응답 시작 전에 닫혔으므로 새로 연다.
+    try:
+        with session_scope() as db:
+            out = _save_generated_turn(db, input_data, response, ctx)
+    except HTTPException as exc:
+        yield _sse("error", {"detail": exc.detail})
+        return
+    yield _sse("done", out.model_dump(mode="json"))
+
+
+@router.post("/steps/generate/stream")
+def stream_emotion_step(
+    input_data: EmotionStepGenerateInput,
+    db: Session = Depends(get_session),
+    emotion_user_id: UUID = Depends(_emotion_user_id),
+):
+    """/steps/generate의 SSE 버전: delta 이벤트로 토큰을 흘리고, 저장이 끝나면 done(스텝)을 보낸다."""
+    ctx = _prepare_generation(db, input_data, emotion_user_id)
+    db.close()
+    return StreamingResponse(
+        _stream_generation(input_data, ctx),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
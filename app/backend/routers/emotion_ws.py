@@ -9,6 +9,8 @@ import logging
 import os
 from contextlib import suppress
 
+import orjson
+
 from sqlalchemy.exc import IntegrityError
 from app.db.session import session_scope  # 컨텍스트 매니저 사용
 from app.backend.schemas.emotion import (
@@ -19,7 +21,6 @@ from app.backend.schemas.emotion import (
     EmotionMessageResponse,
     EmotionCloseRequest,
     TaskRecommendRequest,
-    TaskRecommendResponse,
 )
 from app.backend.services.llm_service import get_backend_llm_info, stream_noa_response
 from app.backend.services.ws_protocol import (
@@ -55,6 +56,7 @@ from app.backend.services.ws_session_service import (
 )
 from app.backend.services.ws_streaming import (
     OutboundWSChannel,
+    encode_ws_frame,
     ws_send_safe as streaming_ws_send_safe,
 )
 from app.backend.services.stream_bridge import iter_chunks_async
@@ -78,6 +80,21 @@ router = APIRouter()
 ws_router = router
 __all__ = ["ws_router", "router"]
 
+# 내용이 고정된 제어 프레임은 모듈 로드 시 한 번만 직렬화해 둔다.
+_PING_FRAME = encode_ws_frame({"type": MSG_PING})
+_PONG_FRAME = encode_ws_frame({"type": MSG_PONG})
+_MESSAGE_START_FRAME = encode_ws_frame({"type": "message_start"})
+_MESSAGE_END_FRAME = encode_ws_frame({"type": "message_end"})
+_ERR_NO_SESSION_FRAME = encode_ws_frame({"type": "error", "message": "no session"})
+_ERR_RECOMMEND_UNAVAILABLE_FRAME = encode_ws_frame({"type": "error", "message": "recommend_unavailable"})
+_ERR_MESSAGE_TOO_LARGE_FRAME = encode_ws_frame({"type": "error", "message": "message_too_large"})
+_ERR_AUTH_REQUIRED_FRAME = encode_ws_frame({"type": "error", "message": "auth_required"})
+
+
+def _delta_frame(delta: str) -> str:
+    # 스트리밍 조각마다 모델 생성/model_dump 없이 delta 문자열만 인코딩해 붙인다.
+    return '{"type":"message_delta","delta":' + orjson.dumps(delta).decode() + "}"
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 설정/상수
 
@@ -86,6 +103,9 @@ class WSConfig:
     WS_IDLE_TIMEOUT: float = float(os.getenv("WS_IDLE_TIMEOUT", "600"))
     WS_SEND_BUFFER: int = int(os.getenv("WS_SEND_BUFFER", "50"))
     WS_HEARTBEAT_SEC: float = float(os.getenv("WS_HEARTBEAT_SEC", "30"))
+    # message_delta 묶음 기준: 이만큼 모이거나 마지막 전송 후 이 시간이 지나면 보낸다.
+    WS_DELTA_BATCH_CHARS: int = int(os.getenv("WS_DELTA_BATCH_CHARS", "60"))
+    WS_DELTA_FLUSH_SEC: float = float(os.getenv("WS_DELTA_FLUSH_SEC", "0.05"))
     LLM_STREAM_TIMEOUT: float = float(os.getenv("LLM_STREAM_TIMEOUT", "120"))
     RECOMMEND_TIMEOUT: float = float(os.getenv("RECOMMEND_TIMEOUT", "15"))
     ANALYSIS_CARD_TIMEOUT: float = float(os.getenv("ANALYSIS_CARD_TIMEOUT", "45"))
@@ -134,7 +154,7 @@ async def ws_emotion(websocket: WebSocket):
 
     session_id: UUID | None = None
     leak_guard = SharedLeakGuard()
-    sys_fp: set[int] = set()
+    sys_fp: frozenset[int] = frozenset()
     shutdown = asyncio.Event()
     recommend_fuse_tripped = False
     activity_fired: bool = False
@@ -154,10 +174,10 @@ async def ws_emotion(websocket: WebSocket):
         logger=logger,
         close_ws=close_ws,
         send_backpressure_error=SendBackpressure,
-        ping_message={"type": MSG_PING},
+        ping_message=_PING_FRAME,
     )
 
-    async def guard_send(data: dict):
+    async def guard_send(data: dict | str):
         await outbound.guard_send(data)
 
     async def flush_outbound_messages() -> None:
@@ -202,7 +222,7 @@ async def ws_emotion(websocket: WebSocket):
         nonlocal activity_fired, recommend_fuse_tripped
 
         if not session_id:
-            await guard_send({"type": "error", "message": "no session"})
+            await guard_send(_ERR_NO_SESSION_FRAME)
             return False
 
         try:
@@ -212,8 +232,12 @@ async def ws_emotion(websocket: WebSocket):
             return False
 
         user_text = payload.text or ""
-        if len(user_text.encode("utf-8")) > CFG.WS_MAX_USER_TEXT_LEN:
-            await guard_send({"type": "error", "message": "message_too_large"})
+        # UTF-8은 글자당 최대 4바이트라, 그 상한으로도 한도 안이면 인코딩 없이 통과시킨다.
+        if (
+            len(user_text) * 4 > CFG.WS_MAX_USER_TEXT_LEN
+            and len(user_text.encode("utf-8")) > CFG.WS_MAX_USER_TEXT_LEN
+        ):
+            await guard_send(_ERR_MESSAGE_TOO_LARGE_FRAME)
             return False
         logger.info("WS recv user | %s", mask_preview(user_text, 100))
 
@@ -250,7 +274,6 @@ async def ws_emotion(websocket: WebSocket):
         assistant_chunks: list[str] = []
         close_filter = StreamingConfirmCloseFilter()
         end_by_token = False
-        _BATCH_CHARS = 60
 
         async def _flush_batch(buf: str) -> None:
             safe = leak_guard.sanitize_out(buf, sys_fp)
@@ -258,11 +281,14 @@ async def ws_emotion(websocket: WebSocket):
                 return
             assistant_chunks.append(safe)
             logger.debug("WS delta | %s", mask_preview(safe))
-            await guard_send(EmotionMessageResponse(type="message_delta", delta=safe).model_dump())
+            await guard_send(_delta_frame(safe))
 
         async def _consume_stream():
             nonlocal end_by_token
             batch_buf = ""
+            loop = asyncio.get_running_loop()
+            # 첫 조각은 바로 보내 첫 토큰 지연을 줄이고, 이후부터 크기/시간 기준으로 묶는다.
+            last_flush: float | None = None
             async for piece in iter_chunks_async(
                 stream_noa_response(
                     system_prompt=system_prompt,
@@ -275,9 +301,15 @@ async def ws_emotion(websocket: WebSocket):
                 emit_raw = close_filter.feed(piece)
                 if emit_raw:
                     batch_buf += emit_raw
-                    if len(batch_buf) >= _BATCH_CHARS:
+                    now = loop.time()
+                    if (
+                        last_flush is None
+                        or len(batch_buf) >= CFG.WS_DELTA_BATCH_CHARS
+                        or now - last_flush >= CFG.WS_DELTA_FLUSH_SEC
+                    ):
                         await _flush_batch(batch_buf)
                         batch_buf = ""
+                        last_flush = now
                 if close_filter.end_detected:
                     break
 
@@ -289,7 +321,7 @@ async def ws_emotion(websocket: WebSocket):
             end_by_token = close_filter.end_detected
 
         stream_failed_reason: str | None = None
-        await guard_send(EmotionMessageResponse(type="message_start").model_dump())
+        await guard_send(_MESSAGE_START_FRAME)
         try:
             await asyncio.wait_for(_consume_stream(), timeout=CFG.LLM_STREAM_TIMEOUT)
         except asyncio.TimeoutError:
@@ -297,7 +329,7 @@ async def ws_emotion(websocket: WebSocket):
         except Exception as e:
             stream_failed_reason = f"stream_failed:{safe_str(e)}"
         finally:
-            await guard_send(EmotionMessageResponse(type="message_end").model_dump())
+            await guard_send(_MESSAGE_END_FRAME)
 
         if stream_failed_reason:
             await guard_send({"type": "error", "message": stream_failed_reason, "turn_dropped": True})
@@ -349,7 +381,7 @@ async def ws_emotion(websocket: WebSocket):
 
         if want_activity:
             if recommend_fuse_tripped:
-                await guard_send({"type": "error", "message": "recommend_unavailable"})
+                await guard_send(_ERR_RECOMMEND_UNAVAILABLE_FRAME)
             else:
                 try:
                     items = await asyncio.wait_for(
@@ -359,12 +391,11 @@ async def ws_emotion(websocket: WebSocket):
                 except Exception as e:
                     recommend_fuse_tripped = True
                     logger.warning("task recommend failed | %s", safe_str(e))
-                    await guard_send({"type": "error", "message": "recommend_unavailable"})
+                    await guard_send(_ERR_RECOMMEND_UNAVAILABLE_FRAME)
                 else:
                     if items:
-                        await guard_send(
-                            TaskRecommendResponse(type="task_recommend_ok", items=items).model_dump()
-                        )
+                        # items는 이미 JSON용 dict 목록이라 모델로 감쌌다 풀지 않는다.
+                        await guard_send({"type": "task_recommend_ok", "items": items})
 
         return False
 
@@ -462,13 +493,13 @@ async def ws_emotion(websocket: WebSocket):
             typ = msg.get("type")
 
             if typ == MSG_PING:
-                await guard_send({"type": MSG_PONG})
+                await guard_send(_PONG_FRAME)
                 continue
 
             # ── 세션 열기
             if typ == MSG_OPEN:
                 if not auth_user_id:
-                    await guard_send({"type": "error", "message": "auth_required"})
+                    await guard_send(_ERR_AUTH_REQUIRED_FRAME)
                     await close_ws(code=4401, reason="auth_required")
                     break
 
@@ -512,7 +543,7 @@ async def ws_emotion(websocket: WebSocket):
             # ── 세션 종료
             elif typ == MSG_CLOSE:
                 if not session_id:
-                    await guard_send({"type": "error", "message": "no session"})
+                    await guard_send(_ERR_NO_SESSION_FRAME)
                     continue
 
                 try:
@@ -526,7 +557,7 @@ async def ws_emotion(websocket: WebSocket):
 
             elif typ == MSG_CONFIRM_CLOSE:
                 if not session_id:
-                    await guard_send({"type": "error", "message": "no session"})
+                    await guard_send(_ERR_NO_SESSION_FRAME)
                     continue
 
                 try:
@@ -546,7 +577,7 @@ async def ws_emotion(websocket: WebSocket):
 
             elif typ == MSG_CANCEL_CLOSE:
                 if not session_id:
-                    await guard_send({"type": "error", "message": "no session"})
+                    await guard_send(_ERR_NO_SESSION_FRAME)
                     continue
 
                 await enter_close_cooldown(send_ack=True)
@@ -554,7 +585,7 @@ async def ws_emotion(websocket: WebSocket):
             # ── 태스크 추천
             elif typ == MSG_TASK_RECOMMEND:
                 if not session_id:
-                    await guard_send({"type": "error", "message": "no session"})
+                    await guard_send(_ERR_NO_SESSION_FRAME)
                     continue
 
                 try:
@@ -564,7 +595,7 @@ async def ws_emotion(websocket: WebSocket):
                     continue
 
                 if recommend_fuse_tripped:
-                    await guard_send({"type": "error", "message": "recommend_unavailable"})
+                    await guard_send(_ERR_RECOMMEND_UNAVAILABLE_FRAME)
                     continue
 
                 try:
@@ -578,10 +609,7 @@ async def ws_emotion(websocket: WebSocket):
                     await guard_send({"type": "error", "message": f"recommend failed: {safe_str(e)}"})
                     continue
 
-                await guard_send(TaskRecommendResponse(
-                    type="task_recommend_ok",
-                    items=recs,
-                ).model_dump())
+                await guard_send({"type": "task_recommend_ok", "items": recs})
 
             else:
                 await guard_send({"type": "error", "message": f"unknown type: {typ}"})
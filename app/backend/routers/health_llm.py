@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 from app.backend.services.llm_service import generate_noa_response, stream_noa_response
 from app.backend.services.stream_bridge import iter_chunks_async
@@ -15,18 +17,57 @@ DEFAULT_PONG_PROMPT = "\ub108\ub294 \uac04\ub2e8\ud788 \ud55c \ub2e8\uc5b4\ub85c
 HEALTHCHECK_QUERY_DESCRIPTION = (
     "\ud14c\uc2a4\ud2b8\uc6a9 \ud504\ub86c\ud504\ud2b8(\uc5c6\uc73c\uba74 \uae30\ubcf8 pong \uac80\uc0ac)"
 )
+CACHE_HEADER = "X-Cache"
+
+# 기본 pong 프로브는 입력이 고정이라, 성공한 결과를 잠시(HEALTH_LLM_CACHE_TTL_SEC) 재사용해
+# 반복 헬스체크가 매번 외부 LLM 호출/토큰 비용을 만들지 않게 한다. 실패는 캐시하지 않는다.
+# 0이면 캐시하지 않는다.
+try:
+    HEALTH_LLM_CACHE_TTL_SEC = float(os.getenv("HEALTH_LLM_CACHE_TTL_SEC", "60"))
+except ValueError:
+    HEALTH_LLM_CACHE_TTL_SEC = 60.0
+
+# system_prompt 라벨 -> (확인 시각(monotonic), 성공 결과)
+_probe_cache: dict[str, tuple[float, dict]] = {}
+_probe_cache_lock = threading.Lock()
+
+
+def _cached_probe(label: str) -> dict | None:
+    cached = _probe_cache.get(label)
+    if cached is None or time.monotonic() - cached[0] >= HEALTH_LLM_CACHE_TTL_SEC:
+        return None
+    return dict(cached[1])
+
+
+def _remember_probe(label: str, result: dict) -> None:
+    if HEALTH_LLM_CACHE_TTL_SEC <= 0:
+        return
+    with _probe_cache_lock:
+        _probe_cache[label] = (time.monotonic(), dict(result))
+
+
+def _mark_cache(response: Response, hit: bool) -> None:
+    response.headers[CACHE_HEADER] = "HIT" if hit else "MISS"
 
 
 @router.get("/llm")
 @limiter.limit("5/minute")
 def health_llm(
     request: Request,
+    response: Response,
     q: Optional[str] = Query(None, max_length=500, description=HEALTHCHECK_QUERY_DESCRIPTION),
 ):
+    conversation = [("user", q or DEFAULT_PONG_PROMPT)]
+    if q is None:
+        cached = _cached_probe("(healthcheck)")
+        if cached is not None:
+            _mark_cache(response, hit=True)
+            return cached
+
     text = generate_noa_response(
         system_prompt="(healthcheck)",
         task_prompt=None,
-        conversation=[("user", q or DEFAULT_PONG_PROMPT)],
+        conversation=conversation,
     )
     text = (text or "").strip()
 
@@ -36,22 +77,34 @@ def health_llm(
     if q is None and "pong" not in text.lower():
         return {"ok": False, "detail": "unexpected_content", "text": text}
 
-    return {"ok": True, "text": text}
+    result = {"ok": True, "text": text}
+    if q is None:
+        _remember_probe("(healthcheck)", result)
+        _mark_cache(response, hit=False)
+    return result
 
 
 @router.get("/llm/stream")
 @limiter.limit("5/minute")
 async def health_llm_stream(
     request: Request,
+    response: Response,
     q: Optional[str] = Query(None, max_length=500, description=HEALTHCHECK_QUERY_DESCRIPTION),
 ):
+    conversation = [("user", q or DEFAULT_PONG_PROMPT)]
+    if q is None:
+        cached = _cached_probe("(healthcheck-stream)")
+        if cached is not None:
+            _mark_cache(response, hit=True)
+            return cached
+
     tokens: list[str] = []
     try:
         async for piece in iter_chunks_async(
             stream_noa_response(
                 system_prompt="(healthcheck-stream)",
                 task_prompt=None,
-                conversation=[("user", q or DEFAULT_PONG_PROMPT)],
+                conversation=conversation,
             )
         ):
             if piece:
@@ -78,4 +131,8 @@ async def health_llm_stream(
             "text": text,
         }
 
-    return {"ok": True, "tokens": len(tokens), "text": text}
+    result = {"ok": True, "tokens": len(tokens), "text": text}
+    if q is None:
+        _remember_probe("(healthcheck-stream)", result)
+        _mark_cache(response, hit=False)
+    return result
@@ -4,22 +4,36 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException, Request, Response, status
-from sqlmodel import Session, select
+from sqlalchemy import update
+from sqlmodel import Session
 
 from app.backend.core.tokens import (
     REFRESH_COOKIE_NAME,
     clear_refresh_cookie,
+    clear_token_cache,
     create_access_token,
-    create_refresh_token,
+    create_refresh_token_with_hash,
     new_refresh_jti,
     set_refresh_cookie,
-    sha256_hex,
+    token_fingerprint_matches,
     verify_refresh_token,
 )
 from app.backend.models.refresh_token import RefreshToken
 from app.backend.models.user import User
 
 
+def revoke_user_refresh_tokens(db: Session, user_id: UUID) -> None:
+    """사용자의 살아 있는 RT를 UPDATE 한 번으로 폐기한다 (커밋은 호출자 몫)."""
+    revoked_jtis = db.exec(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+        .returning(RefreshToken.jti)
+    ).scalars().all()
+    for jti in revoked_jtis:
+        clear_token_cache(jti)
+
+
 async def _extract_refresh_token(request: Request) -> str | None:
     """Read refresh token from HttpOnly cookie only (no JSON/body fallback)."""
     return request.cookies.get(REFRESH_COOKIE_NAME) or None
@@ -51,8 +65,11 @@ async def refresh_tokens(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     sub = payload.get("sub")
-    jti = payload.get("jti")
-    if not sub or not jti:
+    try:
+        jti = UUID(payload.get("jti") or "")
+    except ValueError:
+        jti = None
+    if not sub or jti is None:
         clear_refresh_cookie(response)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token payload")
 
@@ -63,15 +80,13 @@ async def refresh_tokens(
 
     # Reuse detection: anything already revoked or replaced is invalid and revokes all for this user.
     if rt_row.revoked_at is not None or rt_row.replaced_by is not None:
-        for row in db.exec(select(RefreshToken).where(RefreshToken.user_id == rt_row.user_id)):
-            if row.revoked_at is None:
-                row.revoked_at = datetime.utcnow()
+        revoke_user_refresh_tokens(db, rt_row.user_id)
         db.commit()
         clear_refresh_cookie(response)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token reused")
 
-    # Constant-time-ish hash comparison (sha256 hex)
-    if rt_row.token_hash != sha256_hex(rt):
+    # Constant-time fingerprint comparison (blake2b, legacy sha256 rows accepted)
+    if not token_fingerprint_matches(rt_row.token_hash, rt):
         clear_refresh_cookie(response)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token tampered")
 
@@ -83,16 +98,17 @@ async def refresh_tokens(
     # Rotate tokens
     new_access = create_access_token(user.user_id)
     new_jti = new_refresh_jti()
-    new_rt, new_exp = create_refresh_token(user.user_id, new_jti)
+    new_rt, new_rt_hash, new_exp = create_refresh_token_with_hash(user.user_id, new_jti)
 
     rt_row.revoked_at = datetime.utcnow()
     rt_row.replaced_by = new_jti
+    clear_token_cache(jti)
 
     db.add(
         RefreshToken(
             jti=new_jti,
             user_id=user.user_id,
-            token_hash=sha256_hex(new_rt),
+            token_hash=new_rt_hash,
             expires_at=new_exp,
             ip=request.client.host if request.client else None,
             user_agent=request.headers.get("user-agent"),
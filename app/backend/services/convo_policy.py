@@ -4,7 +4,6 @@ from __future__ import annotations
 import os
 from typing import List
 from uuid import UUID
-from datetime import datetime
 
 from sqlalchemy import func
 from sqlmodel import Session, select
@@ -86,7 +85,6 @@ def mark_activity_injected(db: Session, session_id: UUID) -> None:
         step_type=ACTIVITY_STEP_TYPE,   # "activity_suggest"
         user_input="",
         gpt_response="",
-        created_at=datetime.utcnow(),
         insight_tag=None,
     )
     db.add(marker)
@@ -38,13 +38,10 @@ def _build_messages(
             content=_compose_system(system_prompt, task_prompt),
         )
     ]
-    for role, text in conversation:
-        messages.append(
-            LLMMessage(
-                role="user" if role == "user" else "assistant",
-                content=text or "",
-            )
-        )
+    messages.extend(
+        LLMMessage(role="user" if role == "user" else "assistant", content=text or "")
+        for role, text in conversation
+    )
     return messages
 
 
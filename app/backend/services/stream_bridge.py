@@ -2,43 +2,46 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import threading
-from collections.abc import AsyncGenerator, AsyncIterable, Iterable
-from typing import Any
+import os
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+# 동기 LLM 스트림을 한 토큰씩 당겨 오는 공용 스레드 풀.
+# 호출마다 스레드를 새로 띄우지 않고, 워커는 next() 한 번 동안만 점유된다.
+_BRIDGE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LLM_BRIDGE_WORKERS", "32")),
+    thread_name_prefix="llm-bridge",
+)
+_DONE = object()
 
 
 def iter_chunks_async(
     source: Iterable[str] | AsyncIterable[str],
-) -> AsyncGenerator[str, None]:
-    if inspect.isasyncgen(source) or hasattr(source, "__aiter__"):
-        async def _async_passthrough() -> AsyncGenerator[str, None]:
-            async for item in source:  # type: ignore[misc]
-                yield item
-
-        return _async_passthrough()
+) -> AsyncIterator[str]:
+    # 비동기 소스는 감싸지 않고 그대로 돌려준다 (조각마다 래퍼 프레임을 거치지 않도록).
+    if inspect.isasyncgen(source):
+        return source
+    if hasattr(source, "__aiter__"):
+        return source.__aiter__()  # type: ignore[union-attr]
 
     async def _from_sync_iterable() -> AsyncGenerator[str, None]:
         loop = asyncio.get_running_loop()
-        queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
-
-        def _worker() -> None:
-            try:
-                for item in source:  # type: ignore[union-attr]
-                    loop.call_soon_threadsafe(queue.put_nowait, ("data", item))
-            except Exception as exc:
-                loop.call_soon_threadsafe(queue.put_nowait, ("error", exc))
-            finally:
-                loop.call_soon_threadsafe(queue.put_nowait, ("done", None))
-
-        threading.Thread(target=_worker, daemon=True).start()
-
-        while True:
-            kind, payload = await queue.get()
-            if kind == "data":
-                yield payload
-                continue
-            if kind == "error":
-                raise payload
-            break
+        iterator = iter(source)  # type: ignore[arg-type]
+        in_flight = False
+        try:
+            while True:
+                # 소비자가 다음 조각을 원할 때만 당기므로 별도 큐 없이 backpressure가 걸린다.
+                in_flight = True
+                item = await loop.run_in_executor(_BRIDGE_EXECUTOR, next, iterator, _DONE)
+                in_flight = False
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # 소비자가 중간에 멈추면(종료 토큰 등) 남은 업스트림 스트림을 닫는다.
+            # next()가 아직 도는 중(취소)이면 동시에 close할 수 없으므로 건너뛴다.
+            close = getattr(iterator, "close", None)
+            if close is not None and not in_flight:
+                await loop.run_in_executor(_BRIDGE_EXECUTOR, close)
 
     return _from_sync_iterable()
@@ -28,17 +28,26 @@ def load_task_recommendation_context(
     recent_steps_limit: int = 10,
     max_history_chars: int = 1000,
 ) -> TaskRecommendationContext:
-    sess = db.get(EmotionSession, session_id)
-    if not sess or sess.user_id != user_id:
-        raise ValueError("Emotion session not found or not owned by user")
-
+    # 세션 소유 확인과 최근 스텝 조회를 outer join 한 번으로 처리한다.
+    # 스텝이 없는 세션도 (세션 컬럼, NULL, NULL) 한 행으로 돌아온다.
     stmt = (
-        select(EmotionStep)
-        .where(EmotionStep.session_id == session_id)
-        .order_by(EmotionStep.created_at.desc())
-        .limit(recent_steps_limit)
+        select(
+            EmotionSession.user_id,
+            EmotionSession.emotion_label,
+            EmotionSession.topic,
+            EmotionStep.user_input,
+            EmotionStep.gpt_response,
+        )
+        .outerjoin(EmotionStep, EmotionStep.session_id == EmotionSession.session_id)
+        .where(EmotionSession.session_id == session_id)
+        .order_by(EmotionStep.step_order.desc())
+        .limit(max(1, recent_steps_limit))
     )
-    transcript_rows = list(reversed(db.exec(stmt).all()))
+    rows = db.exec(stmt).all()
+    if not rows or rows[0].user_id != user_id:
+        raise ValueError("Emotion session not found or not owned by user")
+    sess = rows[0]
+    transcript_rows = list(reversed(rows[: max(0, recent_steps_limit)]))
 
     history_lines = [
         f"유저: {step.user_input or ''}\nGPT: {step.gpt_response or ''}".strip()
@@ -72,17 +81,18 @@ def persist_task_drafts(
     ]
 
     try:
-        for task in tasks:
-            db.add(task)
+        # PK는 앱에서 uuid4로 채우므로 INSERT 한 번(executemany)으로 묶이고,
+        # created_at은 eager_defaults로 flush 때 함께 받아 온다.
+        db.add_all(tasks)
+        db.flush()
+        # commit이 속성을 만료시키기 전에 값을 떠 두어, 행마다 refresh(SELECT)하지 않는다.
+        out = [Task.model_validate(task) for task in tasks]
         db.commit()
     except Exception:
         db.rollback()
         raise
 
-    for task in tasks:
-        db.refresh(task)
-
-    return tasks
+    return out
 
 
 def recommend_tasks_from_session_core(
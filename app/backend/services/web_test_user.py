@@ -6,23 +6,32 @@ from sqlmodel import Session, select
 
 from app.backend.models.user import User
 
+# email -> user_id. 웹 테스트 유저는 한 번 만들어지면 바뀌지 않으므로
+# 요청마다 SELECT하지 않고 프로세스 수명 동안 기억해 둔다.
+_web_test_user_ids: dict[str, UUID] = {}
+
 
 def ensure_web_test_user(db: Session) -> UUID:
     """
     Upsert a deterministic web-test user and return its UUID.
     """
     email = os.getenv("WEB_TEST_USER_EMAIL", "webtest@local")
+    cached = _web_test_user_ids.get(email)
+    if cached is not None:
+        return cached
     name = os.getenv("WEB_TEST_USER_NAME", "Web Test User")
 
     existing = db.exec(select(User).where(User.email == email)).first()
     if existing:
-        return existing.user_id
-
-    user = User(name=name, email=email)
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user.user_id
+        user_id = existing.user_id
+    else:
+        user = User(name=name, email=email)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        user_id = user.user_id
+    _web_test_user_ids[email] = user_id
+    return user_id
 
 
 def resolve_emotion_user_id(db: Session, current_user: str | UUID | None) -> UUID:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from urllib.parse import parse_qs
 from uuid import UUID
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from app.backend.core.jwt import decode_access_token
@@ -23,6 +23,14 @@ MSG_TASK_RECOMMEND = "task_recommend"
 MSG_PING = "ping"
 MSG_PONG = "pong"
 
+# 본문 없이 type만 담긴 제어 프레임(하트비트 등)은 파싱하지 않고 문자열 그대로 찾는다.
+# 정규식 매칭은 orjson 파싱보다 느려서 흔한 두 가지 직렬화 형태만 정확히 비교한다.
+_CONTROL_FRAMES: dict[str, str] = {
+    frame: typ
+    for typ in (MSG_PING, MSG_PONG, MSG_OPEN, MSG_CLOSE, MSG_CONFIRM_CLOSE, MSG_CANCEL_CLOSE)
+    for frame in (f'{{"type":"{typ}"}}', f'{{"type": "{typ}"}}')
+}
+
 
 class IdleTimeout(Exception):
     """Raised when websocket idle timeout hit."""
@@ -106,9 +114,13 @@ async def ws_recv_safe(
     if text is not None:
         stripped = text.strip()
 
+        control = _CONTROL_FRAMES.get(stripped)
+        if control is not None:
+            return {"type": control}
+
         if stripped and (stripped.startswith("{") or stripped.startswith("[")):
             try:
-                obj = json.loads(stripped)
+                obj = orjson.loads(stripped)
                 if isinstance(obj, dict):
                     if "type" in obj:
                         return obj
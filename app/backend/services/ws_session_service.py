@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable, TypeVar
 from uuid import UUID
@@ -15,6 +18,13 @@ from app.backend.services.ws_utils import transcript_rows_to_conversation
 
 T = TypeVar("T")
 
+# WS 턴의 짧은 DB 작업 전용 스레드 풀. 기본 executor(asyncio.to_thread)는 분석 카드/추천 같은
+# 긴 LLM 작업과 공유되므로 분리하고, 크기는 커넥션 풀(DB_POOL_SIZE)에 맞춘다.
+_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WS_DB_WORKERS", "16")),
+    thread_name_prefix="ws-db",
+)
+
 
 def run_with_session(fn: Callable[[Session], T], *args, **kwargs) -> T:
     with session_scope() as db:
@@ -22,13 +32,15 @@ def run_with_session(fn: Callable[[Session], T], *args, **kwargs) -> T:
 
 
 async def with_db(fn: Callable[[Session], T], *args, **kwargs) -> T:
-    return await asyncio.to_thread(run_with_session, fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _DB_EXECUTOR, functools.partial(run_with_session, fn, *args, **kwargs)
+    )
 
 
 def create_emotion_session(db: Session, user_id: UUID | None) -> EmotionSession:
     session = EmotionSession(
         user_id=user_id,
-        started_at=datetime.utcnow(),
         emotion_label=None,
         topic=None,
         trigger_summary=None,
@@ -51,9 +63,15 @@ def prepare_message_context(
     max_entries = ws_history_turns * 2
     # (session_id, step_order) 복합 인덱스를 역순으로 타서 LIMIT 적용 후 뒤집음.
     # ORDER BY created_at은 인덱스가 없어 풀스캔+정렬이 발생하므로 step_order 사용.
-    rows: list[EmotionStep] = list(
+    # 대화 조립/정책 판단에 쓰는 컬럼만 읽어 ORM 객체 생성 비용을 피한다.
+    rows = list(
         db.exec(
-            select(EmotionStep)
+            select(
+                EmotionStep.step_order,
+                EmotionStep.step_type,
+                EmotionStep.user_input,
+                EmotionStep.gpt_response,
+            )
             .where(EmotionStep.session_id == session_id)
             .order_by(EmotionStep.step_order.desc())
             .limit(max_entries)
@@ -73,7 +91,7 @@ def prepare_message_context(
 
     user_order = last_order + 1
     assistant_order = user_order + 1
-    conversation = transcript_rows_to_conversation(rows) + [("user", user_text)]
+    conversation = transcript_rows_to_conversation(rows, user_text)
     return {
         "transcript_rows": rows,
         "want_activity": want_activity,
@@ -99,7 +117,6 @@ def commit_full_turn(
         step_type="user",
         user_input=user_text,
         gpt_response="",
-        created_at=datetime.utcnow(),
         insight_tag=None,
     )
     assistant_step = EmotionStep(
@@ -108,11 +125,10 @@ def commit_full_turn(
         step_type="assistant",
         user_input="",
         gpt_response=assistant_text,
-        created_at=datetime.utcnow(),
         insight_tag=None,
     )
-    db.add(user_step)
-    db.add(assistant_step)
+    # 세 행 모두 PK(uuid4)를 앱에서 채우므로 flush 때 INSERT 한 번(executemany)으로 묶인다.
+    new_steps = [user_step, assistant_step]
 
     if add_activity_marker:
         marker = EmotionStep(
@@ -121,10 +137,10 @@ def commit_full_turn(
             step_type=ACTIVITY_STEP_TYPE,
             user_input="",
             gpt_response="",
-            created_at=datetime.utcnow(),
             insight_tag=None,
         )
-        db.add(marker)
+        new_steps.append(marker)
+    db.add_all(new_steps)
 
     db.commit()
 
@@ -141,7 +157,7 @@ def close_session_record(db: Session, session_id: UUID, payload: EmotionCloseReq
             session.trigger_summary = payload.trigger_summary
         if payload.insight_summary:
             session.insight_summary = payload.insight_summary
-        db.add(session)
+        # db.get으로 이미 세션에 붙어 있는 객체라 add 없이 commit이 UPDATE를 flush한다.
         db.commit()
 
 
@@ -158,7 +174,6 @@ def append_step_marker(db: Session, session_id: UUID, step_type: str) -> None:
         step_type=step_type,
         user_input="",
         gpt_response="",
-        created_at=datetime.utcnow(),
         insight_tag=None,
     )
     db.add(marker)
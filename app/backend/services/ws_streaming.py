@@ -6,23 +6,44 @@ from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.encoders import jsonable_encoder
 
 from app.backend.services.ws_utils import safe_str
 
 
+def _drop_none(value: Any) -> Any:
+    # 기존 jsonable_encoder(exclude_none=True)처럼 중첩 dict의 None 값까지 뺀다.
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_drop_none(v) for v in value]
+    return value
+
+
+def _encode_fallback(obj: Any) -> Any:
+    # orjson이 모르는 타입(pydantic 모델 등)만 jsonable_encoder로 넘긴다.
+    return jsonable_encoder(obj, exclude_none=True)
+
+
+def encode_ws_frame(data: dict) -> str:
+    """WS로 보낼 dict를 JSON 텍스트 프레임으로 직렬화한다 (UUID/datetime은 orjson이 직접 처리)."""
+    return orjson.dumps(_drop_none(data), default=_encode_fallback).decode()
+
+
 async def ws_send_safe(
     websocket: WebSocket,
-    data: dict,
+    data: dict | str,
     *,
     timeout: float | None = None,
     logger: logging.Logger,
 ) -> None:
-    payload = jsonable_encoder(data, exclude_none=True)
+    # str이면 encode_ws_frame으로 미리 직렬화해 둔 프레임이라 그대로 보낸다.
+    frame = data if isinstance(data, str) else encode_ws_frame(data)
 
     async def _send() -> None:
-        await websocket.send_json(payload)
+        await websocket.send_text(frame)
 
     try:
         if timeout:
@@ -30,7 +51,8 @@ async def ws_send_safe(
         else:
             await _send()
     except Exception as exc:
-        logger.warning("WS send failed | %s | keys=%s", safe_str(exc), list(data.keys()))
+        keys = list(data.keys()) if isinstance(data, dict) else "encoded"
+        logger.warning("WS send failed | %s | keys=%s", safe_str(exc), keys)
 
 
 class OutboundWSChannel:
@@ -44,7 +66,7 @@ class OutboundWSChannel:
         logger: logging.Logger,
         close_ws: Callable[..., Awaitable[None]],
         send_backpressure_error: type[Exception],
-        ping_message: dict[str, Any],
+        ping_message: dict[str, Any] | str,
     ) -> None:
         self.websocket = websocket
         self.heartbeat_sec = heartbeat_sec
@@ -53,7 +75,7 @@ class OutboundWSChannel:
         self.close_ws = close_ws
         self.send_backpressure_error = send_backpressure_error
         self.ping_message = ping_message
-        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=send_buffer)
+        self.queue: asyncio.Queue[dict[str, Any] | str] = asyncio.Queue(maxsize=send_buffer)
         self.loop = asyncio.get_running_loop()
         self.last_active = self.loop.time()
 
@@ -81,7 +103,7 @@ class OutboundWSChannel:
         finally:
             self.shutdown.set()
 
-    async def guard_send(self, data: dict[str, Any]) -> None:
+    async def guard_send(self, data: dict[str, Any] | str) -> None:
         if self.shutdown.is_set():
             return
         try:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
 from typing import Iterable
 from uuid import UUID
 
@@ -30,16 +31,29 @@ def ensure_uuid(value: str | UUID | None) -> UUID | None:
 
 def transcript_rows_to_conversation(
     transcript_rows: Iterable[EmotionStep],
+    next_user_text: str | None = None,
 ) -> list[tuple[str, str]]:
-    conversation: list[tuple[str, str]] = []
-    for row in transcript_rows:
-        if row.step_type == "user" and row.user_input:
-            conversation.append(("user", row.user_input))
-        elif row.step_type == "assistant" and row.gpt_response:
-            conversation.append(("assistant", row.gpt_response))
+    """user/assistant 스텝을 (role, text) 목록으로. next_user_text가 있으면 끝에 이번 발화를 붙인다."""
+    conversation = [
+        ("user", row.user_input) if row.step_type == "user" else ("assistant", row.gpt_response)
+        for row in transcript_rows
+        if (row.step_type == "user" and row.user_input)
+        or (row.step_type == "assistant" and row.gpt_response)
+    ]
+    if next_user_text is not None:
+        conversation.append(("user", next_user_text))
     return conversation
 
 
+def _ngram_hashes(text: str, n: int) -> frozenset[int]:
+    step = max(3, n // 2)
+    return frozenset(hash(text[i : i + n]) for i in range(0, max(0, len(text) - n + 1), step))
+
+
+# 시스템 프롬프트는 프로세스 동안 거의 바뀌지 않으므로 연결마다 다시 계산하지 않는다.
+_cached_ngram_hashes = lru_cache(maxsize=8)(_ngram_hashes)
+
+
 class LeakGuard:
     _DEFAULT_MARKERS = [
         r"<<SYS>>",
@@ -51,32 +65,37 @@ class LeakGuard:
 
     def __init__(self) -> None:
         self.markers: list[str] = list(self._DEFAULT_MARKERS)
+        # 마커마다 re.sub를 돌리지 않도록 하나의 alternation으로 묶어 한 번에 치환한다.
+        self._marker_re = re.compile("|".join(f"(?:{m})" for m in self.markers), re.I)
         self.ngram: int = int(os.getenv("LEAK_GUARD_NGRAM", "20"))
         self.min_match: int = int(os.getenv("LEAK_GUARD_MIN_MATCH", "3"))
         self.mode: str = os.getenv("LEAK_GUARD_MODE", "mask")
 
-    def fingerprint(self, text: str, n: int | None = None) -> set[int]:
+    def fingerprint(self, text: str, n: int | None = None) -> frozenset[int]:
         n = self.ngram if n is None else n
         if not text:
-            return set()
-        step = max(3, n // 2)
-        return {hash(text[i : i + n]) for i in range(0, max(0, len(text) - n + 1), step)}
+            return frozenset()
+        return _cached_ngram_hashes(text, n)
 
-    def _might_leak(self, text: str, sys_fp: set[int], n: int | None = None) -> bool:
+    def _might_leak(self, text: str, sys_fp: frozenset[int], n: int | None = None) -> bool:
         n = self.ngram if n is None else n
         if not text or not sys_fp:
             return False
+        # 청크 전체의 n-gram 집합을 만들지 않고, min_match개가 겹치는 순간 멈춘다.
         step = max(3, n // 2)
-        fp = {hash(text[i : i + n]) for i in range(0, max(0, len(text) - n + 1), step)}
-        return len(sys_fp & fp) >= self.min_match
+        hits: set[int] = set()
+        for i in range(0, len(text) - n + 1, step):
+            h = hash(text[i : i + n])
+            if h in sys_fp:
+                hits.add(h)
+                if len(hits) >= self.min_match:
+                    return True
+        return False
 
     def _redact(self, text: str) -> str:
-        output = text
-        for pattern in self.markers:
-            output = re.sub(pattern, "[redacted]", output, flags=re.I)
-        return output
+        return self._marker_re.sub("[redacted]", text)
 
-    def sanitize_out(self, piece: str, sys_fp: set[int]) -> str:
+    def sanitize_out(self, piece: str, sys_fp: frozenset[int]) -> str:
         if not isinstance(piece, str) or not piece:
             return ""
         if self._might_leak(piece, sys_fp):
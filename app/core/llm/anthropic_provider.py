@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
@@ -41,6 +42,8 @@ class AnthropicProvider(LLMProvider):
     ) -> None:
         self._settings = settings
         self._client = client
+        self._owned_client: Any | None = None
+        self._client_lock = threading.Lock()
 
     def generate_text(
         self,
@@ -166,7 +169,11 @@ class AnthropicProvider(LLMProvider):
             raise RuntimeError("anthropic package is not installed. Check requirements.txt.")
         if not self._settings.anthropic_api_key:
             raise RuntimeError("ANTHROPIC_API_KEY is not configured.")
-        return Anthropic(api_key=self._settings.anthropic_api_key)
+        # provider 인스턴스당 클라이언트(와 httpx 커넥션 풀)를 하나만 만든다.
+        with self._client_lock:
+            if self._owned_client is None:
+                self._owned_client = Anthropic(api_key=self._settings.anthropic_api_key)
+        return self._owned_client
 
     def _get_request_client(self, *, timeout_sec: float) -> Any:
         client = self._get_client()
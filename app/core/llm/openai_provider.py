@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
+import httpx
+import orjson
+
 from .base import LLMProvider
 from .types import JSONValue, LLMJsonSchema, LLMMessage, LLMRequestOptions
 
@@ -23,6 +26,36 @@ except ImportError:  # pragma: no cover
         pass
 
 
+# 역할별 provider(채팅/카드/태스크/욕구)가 같은 OpenAI 엔드포인트를 쓰므로
+# httpx 커넥션 풀 하나를 공유해 TLS 핸드셰이크를 프로세스당 한 번으로 줄인다.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    # httpx의 HTTP/2 지원은 선택 의존성(h2)이 있어야 켜진다.
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_shared_http_client() -> httpx.Client:
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_http_client_lock:
+            if _shared_http_client is None:
+                _shared_http_client = httpx.Client(
+                    http2=_http2_available(),
+                    limits=_HTTP_LIMITS,
+                    timeout=_HTTP_TIMEOUT,
+                )
+    return _shared_http_client
+
+
 @dataclass(frozen=True)
 class _ResolvedOptions:
     model: str
@@ -41,6 +74,8 @@ class OpenAIProvider(LLMProvider):
     ) -> None:
         self._settings = settings
         self._client = client
+        self._owned_client: Any | None = None
+        self._client_lock = threading.Lock()
         self._backup_models = self._resolve_backup_models(backup_models)
 
     def generate_text(
@@ -221,16 +256,32 @@ class OpenAIProvider(LLMProvider):
     def _get_client(self, *, timeout_sec: float) -> Any:
         if self._client is not None:
             return self._client
+        client = self._get_owned_client()
+        if timeout_sec != self._settings.timeout_sec:
+            # with_options는 같은 httpx 커넥션 풀을 공유하는 얕은 복사본을 돌려준다.
+            return client.with_options(timeout=timeout_sec)
+        return client
+
+    def _get_owned_client(self) -> Any:
+        # 호출마다 OpenAI()를 만들면 httpx 풀/TLS 세션을 매번 새로 맺는다.
+        # provider 인스턴스(역할별 lru_cache)당 하나를 만들어 재사용하고,
+        # 밑단 httpx 풀은 모든 provider가 공유한다.
+        if self._owned_client is not None:
+            return self._owned_client
         if OpenAI is None:
             raise RuntimeError("openai package is not installed. Check requirements.txt.")
         from app.core.llm_settings import build_openai_client_kwargs
 
-        return OpenAI(
-            **build_openai_client_kwargs(
-                api_key=self._settings.openai_api_key or None,
-                timeout=timeout_sec,
-            )
-        )
+        with self._client_lock:
+            if self._owned_client is None:
+                self._owned_client = OpenAI(
+                    **build_openai_client_kwargs(
+                        api_key=self._settings.openai_api_key or None,
+                        timeout=self._settings.timeout_sec,
+                    ),
+                    http_client=_get_shared_http_client(),
+                )
+        return self._owned_client
 
     def _chat_fallback_models(self, primary_model: str) -> tuple[str, ...]:
         ordered: list[str] = []
@@ -350,8 +401,8 @@ class OpenAIProvider(LLMProvider):
                 raise RuntimeError("OpenAI JSON generation hit max_output_tokens before any output.")
             raise RuntimeError("LLM returned an empty JSON response.")
         try:
-            return json.loads(raw_text)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(raw_text)
+        except orjson.JSONDecodeError as exc:
             if truncated:
                 raise RuntimeError(
                     "OpenAI JSON generation was truncated by max_output_tokens before completing valid JSON."
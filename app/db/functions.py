@@ -0,0 +1,35 @@
+"""모델 server_default에서 쓰는 SQL 함수."""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """DB가 채우는 현재 UTC 시각 (timezone 없는 timestamp).
+
+    기존 컬럼이 datetime.utcnow()로 채운 naive UTC 값이라 같은 의미를 유지한다.
+    postgres는 clock_timestamp()라서 한 트랜잭션 안의 여러 행도 서로 다른 값을 갖고,
+    sqlite는 밀리초까지 기록해 정렬 순서가 초 단위로 뭉개지지 않게 한다.
+    """
+
+    type = sa.DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw) -> str:
+    return "timezone('utc', clock_timestamp())"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw) -> str:
+    # %f는 "SS.SSS"라서 SQLAlchemy가 바인드하는 "SS.SSSSSS"와 문자열 비교가 어긋난다
+    # (keyset 커서 비교 등). 마이크로초 자리까지 0으로 채워 형식을 맞춘다.
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
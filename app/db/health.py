@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 
 from fastapi import HTTPException
 from sqlmodel import text
@@ -9,6 +12,17 @@ from app.db.session import ensure_required_tables
 
 logger = logging.getLogger(__name__)
 
+# 프로브가 초 단위로 들어와도 실제 DB 확인(SELECT 1 + 테이블 검사)은 TTL마다 한 번만 한다.
+# 0이면 캐시하지 않는다.
+try:
+    HEALTH_DB_CACHE_TTL_SEC = float(os.getenv("HEALTH_DB_CACHE_TTL_SEC", "5"))
+except ValueError:
+    HEALTH_DB_CACHE_TTL_SEC = 5.0
+
+# label -> (확인 시각(monotonic), 실패 시 HTTPException / 성공 시 None)
+_health_cache: dict[str, tuple[float, HTTPException | None]] = {}
+_health_cache_lock = threading.Lock()
+
 
 def check_db_tables(
     engine,
@@ -21,16 +35,39 @@ def check_db_tables(
     logger.info("%s tables verified", label)
 
 
-def health_db_response(
+def _check_health(
     engine,
     required_tables: tuple[str, ...] | list[str],
     label: str,
-) -> dict:
+) -> HTTPException | None:
     try:
         check_db_tables(engine, required_tables, label)
-        return {"ok": True}
+        return None
     except RuntimeError as exc:
         logger.exception("Required %s table check failed", label)
-        raise HTTPException(status_code=500, detail=str(exc))
+        return HTTPException(status_code=500, detail=str(exc))
     except Exception:
-        raise HTTPException(status_code=500, detail="Database connection failed")
+        return HTTPException(status_code=500, detail="Database connection failed")
+
+
+def health_db_response(
+    engine,
+    required_tables: tuple[str, ...] | list[str],
+    label: str,
+) -> dict:
+    now = time.monotonic()
+    cached = _health_cache.get(label)
+    if cached is not None and now - cached[0] < HEALTH_DB_CACHE_TTL_SEC:
+        error = cached[1]
+    else:
+        # 동시에 만료를 본 프로브들이 한꺼번에 DB를 두드리지 않도록 한 스레드만 확인한다.
+        with _health_cache_lock:
+            cached = _health_cache.get(label)
+            if cached is not None and time.monotonic() - cached[0] < HEALTH_DB_CACHE_TTL_SEC:
+                error = cached[1]
+            else:
+                error = _check_health(engine, required_tables, label)
+                _health_cache[label] = (time.monotonic(), error)
+    if error is not None:
+        raise HTTPException(status_code=error.status_code, detail=error.detail)
+    return {"ok": True}
@@ -3,10 +3,10 @@ import logging
 import os
 from contextlib import contextmanager
 from functools import lru_cache
-from urllib.parse import quote_plus
 
 import sqlalchemy as sa
 from sqlalchemy.engine import url as sa_url
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine
 
 log = logging.getLogger(__name__)
@@ -18,16 +18,9 @@ CORE_REQUIRED_TABLES = (
 )
 ANALYZE_REQUIRED_TABLES = CORE_REQUIRED_TABLES + ("analysiscard",)
 
-
-def _mask(url: str) -> str:
-    if "://" not in url:
-        return url
-    scheme, rest = url.split("://", 1)
-    if "@" in rest and ":" in rest.split("@", 1)[0]:
-        creds, tail = rest.split("@", 1)
-        user = creds.split(":", 1)[0]
-        return f"{scheme}://{user}:***@{tail}"
-    return url
+PG_DRIVER_NAME = "postgresql+psycopg"
+# 이 호스트들은 TLS 연결만 받는다. sslmode를 안 적었으면 require를 붙인다.
+HOSTED_SSL_DOMAINS = ("render.com", "neon.tech")
 
 
 def _strip_outer_quotes(s: str) -> str:
@@ -38,18 +31,23 @@ def _strip_outer_quotes(s: str) -> str:
     return s
 
 
-def _build_db_url() -> str:
-    url = os.getenv("DATABASE_URL", "").strip()
-    url = _strip_outer_quotes(url)
+def _needs_ssl(host: str | None) -> bool:
+    return bool(host) and host.endswith(HOSTED_SSL_DOMAINS)
 
-    if url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql+psycopg2://", 1)
 
-    if any(dom in url for dom in ("render.com", "neon.tech")) and "sslmode=" not in url and url:
-        sep = "&" if "?" in url else "?"
-        url = f"{url}{sep}sslmode=require"
+def _build_db_url() -> sa_url.URL:
+    raw = os.getenv("DATABASE_URL", "").strip()
+    raw = _strip_outer_quotes(raw)
 
-    if not url:
+    if raw:
+        try:
+            url = sa_url.make_url(raw)
+        except Exception as exc:
+            raise RuntimeError(f"Invalid DATABASE_URL: {repr(raw)} ({exc})")
+        # 드라이버를 지정하지 않은 URL은 psycopg(v3)로 연결한다. +psycopg2처럼 명시한 건 그대로 둔다.
+        if url.drivername in ("postgres", "postgresql"):
+            url = url.set(drivername=PG_DRIVER_NAME)
+    else:
         host = os.getenv("POSTGRES_HOST", "").strip()
         port = os.getenv("POSTGRES_PORT", "5432").strip()
         db = os.getenv("POSTGRES_DB", "").strip()
@@ -59,36 +57,94 @@ def _build_db_url() -> str:
         if not (host and db and user):
             raise RuntimeError("DATABASE_URL is empty and POSTGRES_* is incomplete")
 
-        if any(ch in pwd for ch in "@:/?#"):
-            pwd = quote_plus(pwd)
+        # URL.create는 비밀번호의 특수문자를 따로 quote할 필요가 없다.
+        url = sa_url.URL.create(
+            PG_DRIVER_NAME,
+            username=user,
+            password=pwd,
+            host=host,
+            port=int(port),
+            database=db,
+        )
 
-        url = f"postgresql+psycopg2://{user}:{pwd}@{host}:{port}/{db}"
+    if _needs_ssl(url.host) and "sslmode" not in url.query:
+        url = url.update_query_dict({"sslmode": "require"})
 
-        if any(dom in host for dom in ("render.com", "neon.tech")):
-            url += "?sslmode=require"
+    log.info("DB URL: %s", url.render_as_string(hide_password=True))
+    return url
 
-    try:
-        sa_url.make_url(url)
-    except Exception as exc:
-        raise RuntimeError(f"Invalid DATABASE_URL: {repr(url)} ({exc})")
 
-    log.info("DB URL: %s", _mask(url))
-    return url
+@lru_cache(maxsize=1)
+def get_database_url_obj() -> sa_url.URL:
+    """파싱된 URL 객체. create_engine에 그대로 넘겨 문자열 재파싱을 건너뛴다."""
+    return _build_db_url()
+
 
 @lru_cache(maxsize=1)
 def get_database_url() -> str:
-    return _build_db_url()
+    # alembic 설정처럼 문자열이 필요한 곳용 (비밀번호 포함).
+    return get_database_url_obj().render_as_string(hide_password=False)
+
+
+def _env_int(key: str, default: int) -> int:
+    raw = os.getenv(key, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        log.warning("Invalid %s=%r, using default %s", key, raw, default)
+        return default
+
+
+def _env_bool(key: str, default: bool) -> bool:
+    v = os.getenv(key)
+    if v is None:
+        return default
+    return v.lower() in ("1", "true", "yes", "on")
+
+
+def _engine_options(url: sa_url.URL) -> dict:
+    # 서버리스(요청마다 프로세스가 뜨는) 배포에서는 풀을 유지하지 않는다.
+    if os.getenv("APP_ENV", "").strip().lower() == "serverless":
+        return {"poolclass": NullPool, "query_cache_size": _env_int("DB_QUERY_CACHE_SIZE", 1200)}
+
+    # 체크아웃마다 SELECT 1을 보내는 pre_ping 대신 TCP keepalive + recycle로
+    # 죽은 커넥션을 걸러낸다. 필요하면 DB_POOL_PRE_PING=true로 되돌릴 수 있다.
+    # LIFO로 최근에 쓴 커넥션부터 다시 꺼내 TLS/서버 캐시가 따뜻한 커넥션을 재사용하고,
+    # 한가할 때는 풀 뒤쪽 커넥션이 자연스럽게 recycle된다.
+    options: dict = {
+        "pool_size": _env_int("DB_POOL_SIZE", 20),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", False),
+        "pool_use_lifo": True,
+        # 컴파일된 SQL 캐시 (기본 500). 라우터별 고정 쿼리가 밀려나지 않게 넉넉히 둔다.
+        "query_cache_size": _env_int("DB_QUERY_CACHE_SIZE", 1200),
+    }
+    if url.get_backend_name() == "postgresql":
+        connect_args: dict = {
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 3,
+        }
+        statement_timeout_ms = _env_int("DB_STATEMENT_TIMEOUT_MS", 5000)
+        if statement_timeout_ms > 0:
+            connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+        if url.drivername == PG_DRIVER_NAME:
+            # 같은 쿼리가 N번 실행되면 서버 측 prepared statement로 바꿔 파싱/계획을 건너뛴다.
+            # prepared statement를 못 쓰는 풀러(구버전 PgBouncer transaction 모드)라면 0으로 끈다.
+            prepare_threshold = _env_int("DB_PREPARE_THRESHOLD", 5)
+            connect_args["prepare_threshold"] = prepare_threshold if prepare_threshold > 0 else None
+        options["connect_args"] = connect_args
+    return options
 
 
 @lru_cache(maxsize=1)
 def get_engine():
-    return create_engine(
-        get_database_url(),
-        pool_pre_ping=True,
-        pool_recycle=1800,
-        pool_size=5,
-        max_overflow=5,
-    )
+    url = get_database_url_obj()
+    return create_engine(url, **_engine_options(url))
 
 
 def get_session():
@@ -1,6 +1,7 @@
 import importlib
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 from uuid import uuid4
@@ -64,7 +65,7 @@ class FakeDB:
         if getattr(obj, "__class__", type(obj)).__name__ == "AnalysisCard":
             self.cards = [c for c in self.cards if c is not obj]
 
-    def commit(self):
+    def flush(self):
         if self._pending_card is not None:
             from sqlalchemy.exc import IntegrityError
             existing = {c.session_id for c in self.cards}
@@ -75,9 +76,15 @@ class FakeDB:
                     params=None,
                     orig=Exception("UNIQUE constraint failed: analysiscard.session_id"),
                 )
+            if self._pending_card.created_at is None:
+                # 실제 DB에서는 server_default가 채운다.
+                self._pending_card.created_at = datetime.utcnow()
             self.cards.append(self._pending_card)
             self._pending_card = None
 
+    def commit(self):
+        self.flush()
+
     def rollback(self):
         self._pending_card = None
 
@@ -453,3 +460,39 @@ def test_auto_from_session_ignores_marker_text_when_building_transcript(monkeypa
     ]
     assert "activity marker should never appear" not in "\n".join(transcript_text)
     assert "cancel_close marker should never appear" not in "\n".join(transcript_text)
+
+
+def test_auto_from_session_commits_read_transaction_before_llm_call(monkeypatch):
+    session_id = uuid4()
+    fake_db = FakeDB(
+        sessions={session_id: SimpleNamespace(session_id=session_id)},
+        steps_by_session={
+            session_id: [
+                _step(session_id, 1, "user", user_input="요즘 계속 불안해요"),
+            ]
+        },
+    )
+    calls = []
+    real_commit = fake_db.commit
+
+    def _recording_commit():
+        calls.append("commit")
+        real_commit()
+
+    fake_db.commit = _recording_commit
+
+    def fake_analyze_dialogue_to_card(*, turns, title_hint):
+        # LLM 호출 전에 읽기 트랜잭션이 끝나 있어야 커넥션을 붙잡지 않는다.
+        assert calls == ["commit"]
+        calls.append("llm")
+        return sc.CardCreate(summary="불안 패턴 요약")
+
+    monkeypatch.setattr(cards, "analyze_dialogue_to_card", fake_analyze_dialogue_to_card)
+    client = _build_client(fake_db)
+
+    response = client.post(f"/api/sessions/{session_id}/cards/auto-from-session")
+
+    assert response.status_code == 200
+    assert calls[:2] == ["commit", "llm"]
+    assert len(fake_db.cards) == 1
+    assert fake_db.cards[0].summary == "불안 패턴 요약"
@@ -155,6 +155,30 @@ def test_get_card_returns_404_for_empty_card(engine, add_analysis_card):
     assert response.status_code == 404
 
 
+def test_get_card_returns_meaningful_card(engine, add_analysis_card):
+    with Session(engine) as db:
+        owner, owner_session = _make_user_and_session(db)
+        card = add_analysis_card(
+            db,
+            owner_session.session_id,
+            summary="요약",
+            core_emotions=[{"primary": "불안", "sub": ["초조한"]}],
+        )
+        owner_user_id = str(owner.user_id)
+        card_id = card.card_id
+
+    client = _build_cards_client(engine, current_user_id=owner_user_id)
+
+    response = client.get(f"/api/cards/{card_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["card_id"] == str(card_id)
+    assert body["core_emotions"] == [
+        {"primary": "불안", "sub": ["초조한"], "quote": None, "reasoning": None}
+    ]
+
+
 def test_list_summaries_excludes_empty_card_but_keeps_meaningful_one(engine, add_analysis_card):
     with Session(engine) as db:
         owner, empty_session = _make_user_and_session(db)
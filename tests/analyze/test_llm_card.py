@@ -397,6 +397,24 @@ class LLMCardTests(unittest.TestCase):
 
         self.assertEqual(card.core_emotions[0].quote, '엄마가 "괜찮아" 라고 했어')
 
+    def test_build_user_prompt_maps_known_speakers_case_insensitively(self) -> None:
+        turns = [
+            sc.ConversationTurn(role="user", speaker="user", text="요즘 잠을 못 자요"),
+            sc.ConversationTurn(role="assistant", speaker="Noa", text="언제부터였나요?"),
+            sc.ConversationTurn(role="system", speaker="coach", text="메모"),
+        ]
+
+        prompt = llm_card._build_user_prompt(turns, title_hint="수면")
+
+        self.assertIn("Title hint: 수면\n\n", prompt)
+        self.assertTrue(
+            prompt.endswith(
+                "[Conversation Start]\n"
+                "User: 요즘 잠을 못 자요\nNoa: 언제부터였나요?\nCOACH: 메모\n"
+                "[Conversation End]"
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
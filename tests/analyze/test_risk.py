@@ -86,3 +86,15 @@ def test_risk_from_payload_scans_insight_field():
     }
     risk_flag, risk_level = risk.risk_from_payload(payload)
     assert risk_flag is True
+
+
+def test_score_picks_highest_level_regardless_of_match_order():
+    # 낮은 단계 키워드가 먼저 나와도 뒤에 나온 높은 단계가 결과가 된다.
+    assert risk.score("우울하고 불안해서 유서를 썼어요") == "HIGH"
+    assert risk.score("힘들어서 다 포기하고 싶어요") == "MEDIUM"
+
+
+def test_score_ignores_spaces_inside_keywords():
+    # 키워드 글자 사이에 공백이 끼어도 공백 제거 후와 같은 결과가 나와야 한다.
+    assert risk.score("자 해 충동") == "MEDIUM"
+    assert risk.score("나 는   죽") == "HIGH"
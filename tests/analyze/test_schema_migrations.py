@@ -87,7 +87,157 @@ def test_head_migration_includes_analysiscard():
             "user",
             "user_need_selection",
         ]
-        assert _alembic_version(tmp_db) == "0014_user_need_selection_session_id"
+        assert _alembic_version(tmp_db) == "0019_emotionsession_user_started_index"
+    finally:
+        if tmp_db.exists():
+            tmp_db.unlink()
+
+
+def test_drop_indexes_for_bulk_recreates_indexes_after_load():
+    import sqlalchemy as sa
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    from app.db.migration_utils import drop_indexes_for_bulk
+
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "bulk_target",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("session_id", sa.String),
+        sa.Column("step_order", sa.Integer),
+        sa.Index("ix_bulk_target_session_order", "session_id", "step_order", unique=True),
+    )
+    metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            from alembic import op
+
+            with drop_indexes_for_bulk("bulk_target", ["ix_bulk_target_session_order"]):
+                assert sa.inspect(conn).get_indexes("bulk_target") == []
+                op.bulk_insert(
+                    table,
+                    [{"session_id": "s", "step_order": i} for i in range(10)],
+                )
+
+        indexes = sa.inspect(conn).get_indexes("bulk_target")
+        assert [(ix["name"], ix["column_names"], bool(ix["unique"])) for ix in indexes] == [
+            ("ix_bulk_target_session_order", ["session_id", "step_order"], True)
+        ]
+        assert conn.execute(sa.select(sa.func.count()).select_from(table)).scalar() == 10
+
+
+def test_drop_indexes_for_bulk_keeps_partial_index_and_column_sorting(monkeypatch):
+    import sqlalchemy as sa
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    from app.db import migration_utils
+    from app.db.migration_utils import drop_indexes_for_bulk
+
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE bulk_target (id INTEGER PRIMARY KEY, u TEXT, r TEXT)")
+        conn.exec_driver_sql("CREATE INDEX ix_partial ON bulk_target (u) WHERE r IS NULL")
+        conn.exec_driver_sql("CREATE INDEX ix_sorted ON bulk_target (u DESC, r)")
+
+    # sqlite 리플렉션은 컬럼 정렬을 돌려주지 않으므로 postgres처럼 column_sorting을 채워 준다.
+    real_inspect = sa.inspect
+
+    class _SortingInspector:
+        def __init__(self, bind):
+            self._inspector = real_inspect(bind)
+
+        def get_indexes(self, table_name):
+            indexes = self._inspector.get_indexes(table_name)
+            for ix in indexes:
+                if ix["name"] == "ix_sorted":
+                    ix["column_sorting"] = {"u": ("desc",)}
+            return indexes
+
+    monkeypatch.setattr(migration_utils.sa, "inspect", _SortingInspector)
+
+    def _index_sql(conn):
+        rows = conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'bulk_target'"
+        ).fetchall()
+        return {name: " ".join(sql.split()) for name, sql in rows}
+
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            with drop_indexes_for_bulk("bulk_target", ["ix_partial", "ix_sorted"]):
+                assert _index_sql(conn) == {}
+                conn.exec_driver_sql("INSERT INTO bulk_target (u, r) VALUES ('a', NULL), ('b', 'x')")
+
+        index_sql = _index_sql(conn)
+
+    assert index_sql["ix_partial"].endswith("ON bulk_target (u) WHERE r IS NULL")
+    assert index_sql["ix_sorted"].endswith("ON bulk_target (u DESC, r)")
+
+
+def test_refreshtoken_jti_migration_converts_existing_rows():
+    tmp_db = _new_tmp_db("rt-uuid")
+    jti = str(uuid4())
+    try:
+        _run_alembic(tmp_db, "0016_analysiscard_created_at_server_default")
+        user_id = uuid4().hex
+        conn = sqlite3.connect(tmp_db)
+        try:
+            conn.execute(
+                "insert into user (user_id, name, email, created_at) values (?, ?, ?, ?)",
+                (user_id, "tester", "rt@example.com", "2026-01-01 00:00:00"),
+            )
+            conn.execute(
+                "insert into refreshtoken (jti, user_id, token_hash, created_at, expires_at) "
+                "values (?, ?, ?, ?, ?)",
+                (jti, user_id, "hash", "2026-01-01 00:00:00", "2026-02-01 00:00:00"),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        _run_alembic(tmp_db, "0017_refreshtoken_uuid_jti")
+
+        conn = sqlite3.connect(tmp_db)
+        try:
+            assert conn.execute("select jti from refreshtoken").fetchone()[0] == jti.replace("-", "")
+            index_names = [
+                row[1] for row in conn.execute("pragma index_list('refreshtoken')").fetchall()
+            ]
+            assert "ix_refreshtoken_user_active" in index_names
+        finally:
+            conn.close()
+    finally:
+        if tmp_db.exists():
+            tmp_db.unlink()
+
+
+def test_core_timestamp_columns_default_to_db_time():
+    tmp_db = _new_tmp_db("core-ts")
+    try:
+        _run_alembic(tmp_db, "head")
+        user_id = uuid4().hex
+        conn = sqlite3.connect(tmp_db)
+        try:
+            conn.execute(
+                "insert into user (user_id, name, email) values (?, ?, ?)",
+                (user_id, "tester", "ts@example.com"),
+            )
+            conn.execute(
+                "insert into emotionsession (session_id, user_id) values (?, ?)",
+                (uuid4().hex, user_id),
+            )
+            assert conn.execute("select created_at from user").fetchone()[0]
+            assert conn.execute("select started_at from emotionsession").fetchone()[0]
+            index_sql = conn.execute(
+                "select sql from sqlite_master where name = 'ix_refreshtoken_user_active'"
+            ).fetchone()[0]
+            assert "revoked_at IS NULL" in index_sql
+        finally:
+            conn.close()
     finally:
         if tmp_db.exists():
             tmp_db.unlink()
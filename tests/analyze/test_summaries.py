@@ -103,3 +103,47 @@ def test_list_session_summaries_excludes_other_users_session(engine, add_analysi
 
     assert response.status_code == 200
     assert response.json() == []
+
+
+def test_list_summaries_pages_with_cursor(engine, add_analysis_card):
+    from datetime import datetime, timedelta
+
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    with Session(engine) as db:
+        owner, _ = _make_user_and_session(db)
+        expected = []
+        for i in range(3):
+            session = emotion_models.EmotionSession(user_id=owner.user_id)
+            db.add(session)
+            db.commit()
+            db.refresh(session)
+            add_analysis_card(
+                db,
+                session.session_id,
+                summary=f"요약 {i}",
+                created_at=base + timedelta(minutes=i),
+            )
+            expected.append(f"요약 {i}")
+        owner_user_id = str(owner.user_id)
+
+    client = _build_client(engine, current_user_id=owner_user_id)
+
+    first = client.get("/api/summaries", params={"limit": 2})
+    assert first.status_code == 200
+    assert [card["summary"] for card in first.json()] == ["요약 2", "요약 1"]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/api/summaries", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert [card["summary"] for card in second.json()] == ["요약 0"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_list_summaries_rejects_invalid_cursor(engine):
+    with Session(engine) as db:
+        owner, _ = _make_user_and_session(db)
+        owner_user_id = str(owner.user_id)
+
+    client = _build_client(engine, current_user_id=owner_user_id)
+
+    assert client.get("/api/summaries", params={"cursor": "not-a-cursor"}).status_code == 400
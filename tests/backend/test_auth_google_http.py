@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+os.environ.setdefault("JWT_SECRET_KEY", "test_secret")
+os.environ.setdefault("JWT_REFRESH_SECRET", "test_refresh")
+
+from app.backend.routers import auth
+
+
+def test_google_http_client_is_shared_until_closed(monkeypatch):
+    monkeypatch.setattr(auth, "_google_http", None)
+
+    first = auth._get_google_http()
+    assert auth._get_google_http() is first
+
+    asyncio.run(auth.close_google_http())
+    assert first.is_closed
+
+    second = auth._get_google_http()
+    assert second is not first
+    asyncio.run(auth.close_google_http())
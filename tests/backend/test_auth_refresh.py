@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("JWT_SECRET_KEY", "test_secret")
+os.environ.setdefault("JWT_REFRESH_SECRET", "test_refresh")
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.backend.core.tokens import REFRESH_COOKIE_NAME
+from app.backend.models.refresh_token import RefreshToken
+from app.backend.models.user import User
+from app.backend.routers import auth
+from app.db.session import get_session
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _build_client(engine) -> TestClient:
+    app = FastAPI()
+    app.include_router(auth.auth_router)
+
+    def _get_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _get_db
+    return TestClient(app)
+
+
+def _login(engine) -> str:
+    with Session(engine) as db:
+        user = User(name="tester", email="rt@example.com")
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        response = Response()
+        auth.issue_tokens_for_user(db, user, response)
+    cookie = response.headers["set-cookie"]
+    return cookie.split(";", 1)[0].split("=", 1)[1]
+
+
+def _refresh(client: TestClient, token: str):
+    return client.post("/auth/refresh", headers={"Cookie": f"{REFRESH_COOKIE_NAME}={token}"})
+
+
+def test_refresh_rotates_token_and_links_replacement(engine):
+    client = _build_client(engine)
+    token = _login(engine)
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 200
+    with Session(engine) as db:
+        rows = db.exec(select(RefreshToken)).all()
+        assert len(rows) == 2
+        old = next(row for row in rows if row.revoked_at is not None)
+        new = next(row for row in rows if row.revoked_at is None)
+        assert old.replaced_by == new.jti
+
+
+def test_reused_refresh_token_revokes_all_user_tokens(engine):
+    client = _build_client(engine)
+    token = _login(engine)
+    assert _refresh(client, token).status_code == 200
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token reused"
+    with Session(engine) as db:
+        assert all(row.revoked_at is not None for row in db.exec(select(RefreshToken)))
+
+
+def test_logout_revokes_active_refresh_tokens(engine):
+    client = _build_client(engine)
+    _login(engine)
+    with Session(engine) as db:
+        user_id = str(db.exec(select(User)).one().user_id)
+    client.app.dependency_overrides[auth.get_current_user] = lambda: user_id
+
+    response = client.get("/auth/logout")
+
+    assert response.status_code == 200
+    with Session(engine) as db:
+        rows = db.exec(select(RefreshToken)).all()
+        assert rows and all(row.revoked_at is not None for row in rows)
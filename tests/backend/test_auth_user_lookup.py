@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("JWT_SECRET_KEY", "test_secret")
+os.environ.setdefault("JWT_REFRESH_SECRET", "test_refresh")
+
+from collections import OrderedDict
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.backend.routers import auth
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(auth, "_email_to_uid", OrderedDict())
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def test_get_or_create_user_uses_cached_user_id_on_repeat_login(engine, monkeypatch):
+    with Session(engine) as db:
+        created_id = auth._get_or_create_user(db, email="a@example.com", name="A").user_id
+        db.commit()
+
+    with Session(engine) as db:
+        def _no_select(*args, **kwargs):
+            raise AssertionError("email lookup should be served from the cache")
+
+        monkeypatch.setattr(db, "exec", _no_select)
+        again = auth._get_or_create_user(db, email="a@example.com", name="A")
+
+    assert again.user_id == created_id
+
+
+def test_forget_user_email_falls_back_to_query(engine):
+    with Session(engine) as db:
+        created_id = auth._get_or_create_user(db, email="b@example.com", name="B").user_id
+        db.commit()
+
+    auth.forget_user_email("b@example.com")
+    assert "b@example.com" not in auth._email_to_uid
+
+    with Session(engine) as db:
+        again = auth._get_or_create_user(db, email="b@example.com", name="B")
+
+    assert again.user_id == created_id
+
+
+def test_new_user_login_commits_once(engine):
+    from starlette.responses import Response
+
+    from app.backend.models.refresh_token import RefreshToken
+    from app.backend.models.user import User
+
+    with Session(engine) as db:
+        commits = []
+        real_commit = db.commit
+
+        def _counting_commit():
+            commits.append(1)
+            real_commit()
+
+        db.commit = _counting_commit
+        user = auth._get_or_create_user(db, email="c@example.com", name="C")
+        auth.issue_tokens_for_user(db, user, Response())
+
+    assert len(commits) == 1
+    with Session(engine) as db:
+        stored = db.query(User).filter(User.email == "c@example.com").one()
+        assert db.query(RefreshToken).filter(RefreshToken.user_id == stored.user_id).count() == 1
+
+
+def test_cached_user_id_hit_refreshes_lru_order(monkeypatch):
+    from uuid import uuid4
+
+    monkeypatch.setattr(auth, "_email_to_uid", OrderedDict())
+    monkeypatch.setattr(auth, "_EMAIL_TO_UID_MAXSIZE", 2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    auth._remember_user_id("first@example.com", first)
+    auth._remember_user_id("second@example.com", second)
+
+    assert auth._cached_user_id("first@example.com") == first
+    auth._remember_user_id("third@example.com", third)
+
+    # 최근에 조회된 first는 남고, 가장 오래 안 쓰인 second가 밀려나야 한다.
+    assert list(auth._email_to_uid) == ["first@example.com", "third@example.com"]
@@ -1,6 +1,8 @@
 import importlib
+import json
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
@@ -8,8 +10,9 @@ from uuid import uuid4
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
 os.environ.setdefault("JWT_SECRET_KEY", "test_secret")
 os.environ.setdefault("JWT_REFRESH_SECRET", "test_refresh")
@@ -23,6 +26,7 @@ emotion_router = importlib.import_module("app.backend.routers.emotion")
 emotion_models = importlib.import_module("app.backend.models.emotion")
 user_model = importlib.import_module("app.backend.models.user")
 db_session_module = importlib.import_module("app.db.session")
+ws_session_service = importlib.import_module("app.backend.services.ws_session_service")
 
 
 @pytest.fixture
@@ -195,3 +199,329 @@ def test_list_sessions_includes_sessions_with_analysis_card(engine, add_analysis
     body = response.json()
     assert len(body) == 1
     assert body[0]["session_id"] == kept_id
+
+
+def test_generate_step_appends_after_existing_steps(engine, monkeypatch):
+    monkeypatch.setattr(emotion_router, "generate_noa_response", lambda **kwargs: "노아 응답")
+    monkeypatch.setattr(emotion_router, "is_activity_turn", lambda **kwargs: False)
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        _add_step(db, session.session_id, order=1, user_input="안녕")
+        _add_step(db, session.session_id, order=2, user_input="")
+        user_id = user.user_id
+        session_id = session.session_id
+
+    client = _build_client(engine, user_id)
+    step_inserts = []
+
+    def _record_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO emotionstep"):
+            step_inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record_insert)
+    try:
+        response = client.post(
+            "/emotion/steps/generate",
+            json={"session_id": str(session_id), "step_type": "user", "user_input": "오늘 힘들었어"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record_insert)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["step_order"] == 4
+    # user + assistant 스텝이 INSERT 한 번으로 저장된다.
+    assert len(step_inserts) == 1
+    assert body["gpt_response"] == "노아 응답"
+
+    other = client.post(
+        "/emotion/steps/generate",
+        json={"session_id": str(uuid4()), "step_type": "user", "user_input": "안녕"},
+    )
+    assert other.status_code == 404
+
+
+def test_generate_step_sends_only_recent_window_to_llm(engine, monkeypatch):
+    seen = {}
+
+    def _fake_generate(**kwargs):
+        seen["conversation"] = kwargs["conversation"]
+        return "노아 응답"
+
+    monkeypatch.setattr(emotion_router, "generate_noa_response", _fake_generate)
+    monkeypatch.setattr(emotion_router, "is_activity_turn", lambda **kwargs: False)
+    monkeypatch.setattr(emotion_router, "MAX_CONTEXT_STEPS", 4)
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        for order in range(1, 11):
+            _add_step(db, session.session_id, order=order, user_input="")
+        db.add(
+            emotion_models.EmotionStep(
+                session_id=session.session_id,
+                step_order=11,
+                step_type="user",
+                user_input="최근 발화",
+                gpt_response="",
+            )
+        )
+        db.commit()
+        user_id = user.user_id
+        session_id = session.session_id
+
+    client = _build_client(engine, user_id)
+
+    response = client.post(
+        "/emotion/steps/generate",
+        json={"session_id": str(session_id), "step_type": "user", "user_input": "지금"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["step_order"] == 13
+    assert seen["conversation"] == [("user", "최근 발화"), ("user", "지금")]
+
+
+def test_list_sessions_pages_with_cursor(engine):
+    with Session(engine) as db:
+        user, first = _make_user_and_session(db)
+        sessions = [first]
+        for _ in range(2):
+            extra = emotion_models.EmotionSession(user_id=user.user_id)
+            db.add(extra)
+            db.commit()
+            sessions.append(extra)
+        for sess in sessions:
+            _add_step(db, sess.session_id, order=1, user_input="안녕")
+            _end_session(db, sess)
+        user_id = user.user_id
+        expected = [
+            str(s.session_id)
+            for s in sorted(sessions, key=lambda s: (s.started_at, s.session_id), reverse=True)
+        ]
+
+    client = _build_client(engine, user_id)
+
+    page1 = client.get("/emotion/sessions", params={"limit": 2})
+    assert page1.status_code == 200
+    assert [s["session_id"] for s in page1.json()] == expected[:2]
+    cursor = page1.headers["X-Next-Cursor"]
+
+    page2 = client.get("/emotion/sessions", params={"limit": 2, "cursor": cursor})
+    assert page2.status_code == 200
+    assert [s["session_id"] for s in page2.json()] == expected[2:]
+    assert "X-Next-Cursor" not in page2.headers
+
+    both = client.get("/emotion/sessions", params={"cursor": cursor, "offset": 0})
+    assert both.status_code == 400
+
+
+def test_list_steps_pages_with_step_order_cursor(engine):
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        for order in range(1, 6):
+            _add_step(db, session.session_id, order=order, user_input=f"발화 {order}")
+        user_id = user.user_id
+        session_id = str(session.session_id)
+
+    client = _build_client(engine, user_id)
+
+    page1 = client.get("/emotion/steps", params={"session_id": session_id, "limit": 3})
+    assert [s["step_order"] for s in page1.json()] == [1, 2, 3]
+    assert page1.headers["X-Next-Cursor"] == "3"
+
+    page2 = client.get(
+        "/emotion/steps",
+        params={"session_id": session_id, "limit": 3, "cursor": page1.headers["X-Next-Cursor"]},
+    )
+    assert [s["step_order"] for s in page2.json()] == [4, 5]
+    assert "X-Next-Cursor" not in page2.headers
+
+
+def test_list_steps_hides_other_users_sessions(engine):
+    with Session(engine) as db:
+        owner, session = _make_user_and_session(db)
+        _add_step(db, session.session_id, order=1, user_input="안녕")
+        other, empty_session = _make_user_and_session(db)
+        session_id = str(session.session_id)
+        empty_session_id = str(empty_session.session_id)
+        other_id = other.user_id
+
+    client = _build_client(engine, other_id)
+
+    assert client.get("/emotion/steps", params={"session_id": session_id}).status_code == 404
+    empty = client.get("/emotion/steps", params={"session_id": empty_session_id})
+    assert empty.status_code == 200
+    assert empty.json() == []
+
+
+def test_generate_step_releases_connection_during_llm_call(engine, monkeypatch):
+    sessions = []
+
+    def _get_db():
+        with Session(engine) as session:
+            sessions.append(session)
+            yield session
+
+    def _fake_generate(**kwargs):
+        assert not sessions[0].in_transaction()
+        return "노아 응답"
+
+    monkeypatch.setattr(emotion_router, "generate_noa_response", _fake_generate)
+    monkeypatch.setattr(emotion_router, "is_activity_turn", lambda **kwargs: False)
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        _add_step(db, session.session_id, order=1, user_input="안녕")
+        user_id = user.user_id
+        session_id = session.session_id
+
+    client = _build_client(engine, user_id)
+    client.app.dependency_overrides[db_session_module.get_session] = _get_db
+
+    response = client.post(
+        "/emotion/steps/generate",
+        json={"session_id": str(session_id), "step_type": "user", "user_input": "오늘 힘들었어"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["step_order"] == 3
+
+
+def test_create_session_returns_db_filled_started_at(engine):
+    with Session(engine) as db:
+        user = user_model.User(name="tester", email=f"{uuid4()}@example.com")
+        db.add(user)
+        db.commit()
+        user_id = user.user_id
+
+    client = _build_client(engine, user_id)
+
+    response = client.post("/emotion/sessions", json={"topic": "일"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["user_id"] == str(user_id)
+    assert body["topic"] == "일"
+    assert body["started_at"]
+
+
+def test_create_step_checks_session_owner(engine):
+    with Session(engine) as db:
+        owner, session = _make_user_and_session(db)
+        other, _ = _make_user_and_session(db)
+        owner_id, other_id = owner.user_id, other.user_id
+        session_id = str(session.session_id)
+
+    payload = {
+        "session_id": session_id,
+        "step_order": 1,
+        "step_type": "user",
+        "user_input": "안녕",
+        "gpt_response": "",
+    }
+
+    denied = _build_client(engine, other_id).post("/emotion/steps", json=payload)
+    assert denied.status_code == 404
+
+    created = _build_client(engine, owner_id).post("/emotion/steps", json=payload)
+    assert created.status_code == 200
+    body = created.json()
+    assert body["session_id"] == session_id
+    assert body["user_input"] == "안녕"
+    assert body["created_at"]
+
+    with Session(engine) as db:
+        steps = db.exec(select(emotion_models.EmotionStep)).all()
+    assert [s.step_order for s in steps] == [1]
+
+
+def test_generate_stream_sends_deltas_then_saves_turn(engine, monkeypatch):
+    pieces = ["오늘은 ", "푹 쉬어", " [[CONFIRM_", "CLOSE]] 남는 말"]
+    monkeypatch.setattr(emotion_router, "stream_noa_response", lambda **kwargs: iter(pieces))
+    monkeypatch.setattr(emotion_router, "is_activity_turn", lambda **kwargs: False)
+
+    @contextmanager
+    def _scope():
+        with Session(engine) as db:
+            yield db
+
+    monkeypatch.setattr(emotion_router, "session_scope", _scope)
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        _add_step(db, session.session_id, order=1, user_input="안녕")
+        user_id = user.user_id
+        session_id = session.session_id
+
+    response = _build_client(engine, user_id).post(
+        "/emotion/steps/generate/stream",
+        json={"session_id": str(session_id), "step_type": "user", "user_input": "피곤해"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n", 1) for block in response.text.strip().split("\n\n")]
+    names = [head.removeprefix("event: ") for head, _ in events]
+    assert names == ["delta", "delta", "done"]
+    done = json.loads(events[-1][1].removeprefix("data: "))
+    assert done["step_order"] == 3
+    assert done["gpt_response"] == "오늘은 푹 쉬어"
+
+    with Session(engine) as db:
+        steps = db.exec(
+            select(emotion_models.EmotionStep)
+            .where(emotion_models.EmotionStep.session_id == session_id)
+            .order_by(emotion_models.EmotionStep.step_order)
+        ).all()
+    assert [(s.step_order, s.step_type) for s in steps] == [(1, "message"), (2, "user"), (3, "assistant")]
+
+
+def test_ws_prepare_message_context_uses_recent_window(engine):
+    with Session(engine) as db:
+        _user, session = _make_user_and_session(db)
+        for order in range(1, 6):
+            _add_step(db, session.session_id, order=order, user_input=f"말 {order}")
+        session_id = session.session_id
+
+    with Session(engine) as db:
+        prep = ws_session_service.prepare_message_context(
+            db, session_id, "새 말", ws_history_turns=1, already_fired=False
+        )
+
+    assert (prep["user_order"], prep["assistant_order"]) == (6, 7)
+    assert [row.step_order for row in prep["transcript_rows"]] == [4, 5]
+    assert prep["conversation"][-1] == ("user", "새 말")
+
+
+def test_generate_stream_reports_error_and_drops_turn_when_llm_fails(engine, monkeypatch):
+    def _failing_stream(**kwargs):
+        yield "오늘은 "
+        raise RuntimeError("upstream timeout")
+
+    monkeypatch.setattr(emotion_router, "stream_noa_response", _failing_stream)
+    monkeypatch.setattr(emotion_router, "is_activity_turn", lambda **kwargs: False)
+
+    @contextmanager
+    def _scope():
+        with Session(engine) as db:
+            yield db
+
+    monkeypatch.setattr(emotion_router, "session_scope", _scope)
+    with Session(engine) as db:
+        user, session = _make_user_and_session(db)
+        user_id = user.user_id
+        session_id = session.session_id
+
+    response = _build_client(engine, user_id).post(
+        "/emotion/steps/generate/stream",
+        json={"session_id": str(session_id), "step_type": "user", "user_input": "피곤해"},
+    )
+
+    assert response.status_code == 200
+    events = [block.split("\n", 1) for block in response.text.strip().split("\n\n")]
+    assert [head.removeprefix("event: ") for head, _ in events] == ["delta", "error"]
+    error = json.loads(events[-1][1].removeprefix("data: "))
+    assert error == {"detail": "stream_failed", "turn_dropped": True}
+
+    with Session(engine) as db:
+        steps = db.exec(
+            select(emotion_models.EmotionStep).where(emotion_models.EmotionStep.session_id == session_id)
+        ).all()
+    assert steps == []
@@ -389,3 +389,53 @@ def test_cancel_close_ack_keeps_session_open_for_followup_messages(ws_harness):
         step.step_type == emotion_ws.CANCEL_CLOSE_STEP_TYPE
         for step in store.steps
     )
+
+
+def _send_message_and_collect_until_reply(ws, text: str) -> list[dict]:
+    # delta 프레임 수가 달라져도 멈추지 않도록 최종 message 이벤트까지 모은다.
+    ws.send_json({"type": "message", "text": text})
+    events = []
+    while not events or events[-1]["type"] not in ("message", "error"):
+        events.append(_receive_non_step_event(ws))
+    return events
+
+
+def test_stream_deltas_send_first_piece_then_batch_by_size(ws_harness, monkeypatch):
+    store, client = ws_harness
+    store.current_steps = [3]
+    monkeypatch.setattr(emotion_ws.CFG, "WS_DELTA_BATCH_CHARS", 4)
+    monkeypatch.setattr(emotion_ws.CFG, "WS_DELTA_FLUSH_SEC", 1000.0)
+    monkeypatch.setattr(
+        emotion_ws,
+        "stream_noa_response",
+        lambda **_kwargs: iter(["a", "bb", "cc", "dd", "ee", "f"]),
+    )
+
+    with _open_ws(client) as ws:
+        events = _send_message_and_collect_until_reply(ws, "hello")
+
+    assert [event["type"] for event in events] == (
+        ["message_start"] + ["message_delta"] * 4 + ["message_end", "message"]
+    )
+    assert [event["delta"] for event in events[1:5]] == ["a", "bbcc", "ddee", "f"]
+    assert events[-1]["message"] == "abbccddeef"
+
+
+def test_stream_deltas_flush_on_elapsed_time(ws_harness, monkeypatch):
+    store, client = ws_harness
+    store.current_steps = [3]
+    monkeypatch.setattr(emotion_ws.CFG, "WS_DELTA_BATCH_CHARS", 1000)
+    monkeypatch.setattr(emotion_ws.CFG, "WS_DELTA_FLUSH_SEC", 0.0)
+    monkeypatch.setattr(
+        emotion_ws,
+        "stream_noa_response",
+        lambda **_kwargs: iter(["a", "bb", "cc"]),
+    )
+
+    with _open_ws(client) as ws:
+        events = _send_message_and_collect_until_reply(ws, "hello")
+
+    assert [event["type"] for event in events] == (
+        ["message_start"] + ["message_delta"] * 3 + ["message_end", "message"]
+    )
+    assert [event["delta"] for event in events[1:4]] == ["a", "bb", "cc"]
@@ -32,6 +32,10 @@ def _install_fastapi_stub():
     class Request:
         pass
 
+    class Response:
+        def __init__(self) -> None:
+            self.headers = {}
+
     def Query(default=None, **kwargs):
         return default
 
@@ -39,10 +43,15 @@ def _install_fastapi_stub():
     fastapi.HTTPException = HTTPException
     fastapi.Query = Query
     fastapi.Request = Request
+    fastapi.Response = Response
     sys.modules["fastapi"] = fastapi
     return HTTPException
 
 
+def _response():
+    return sys.modules["fastapi"].Response()
+
+
 def _load_health_module():
     http_exception = _install_fastapi_stub()
     sys.modules.pop("app.backend.routers.health_llm", None)
@@ -71,7 +80,7 @@ class HealthLLMTests(unittest.TestCase):
 
         module.generate_noa_response = _fake_generate_noa_response
 
-        result = module.health_llm(request=None)
+        result = module.health_llm(request=None, response=_response())
 
         self.assertEqual(result, {"ok": True, "text": "pong"})
         self.assertEqual(
@@ -83,12 +92,34 @@ class HealthLLMTests(unittest.TestCase):
             },
         )
 
+    def test_health_llm_reuses_successful_default_probe(self) -> None:
+        module, _ = _load_health_module()
+        calls = []
+
+        def _fake_generate_noa_response(**kwargs):
+            calls.append(kwargs)
+            return "pong"
+
+        module.generate_noa_response = _fake_generate_noa_response
+        first_response = sys.modules["fastapi"].Response()
+        second_response = sys.modules["fastapi"].Response()
+
+        first = module.health_llm(request=None, response=first_response)
+        second = module.health_llm(request=None, response=second_response)
+        module.health_llm(request=None, response=_response(), q="say hello")
+
+        self.assertEqual(first, {"ok": True, "text": "pong"})
+        self.assertEqual(second, first)
+        self.assertEqual(first_response.headers, {"X-Cache": "MISS"})
+        self.assertEqual(second_response.headers, {"X-Cache": "HIT"})
+        self.assertEqual(len(calls), 2)
+
     def test_health_llm_raises_on_empty_text(self) -> None:
         module, http_exception = _load_health_module()
         module.generate_noa_response = lambda **kwargs: ""
 
         with self.assertRaises(http_exception) as ctx:
-            module.health_llm(request=None)
+            module.health_llm(request=None, response=_response())
 
         self.assertEqual(ctx.exception.status_code, 503)
         self.assertEqual(ctx.exception.detail, "llm_empty_response")
@@ -97,7 +128,7 @@ class HealthLLMTests(unittest.TestCase):
         module, _ = _load_health_module()
         module.generate_noa_response = lambda **kwargs: "hello"
 
-        result = module.health_llm(request=None)
+        result = module.health_llm(request=None, response=_response())
 
         self.assertEqual(
             result,
@@ -114,7 +145,7 @@ class HealthLLMTests(unittest.TestCase):
 
         module.generate_noa_response = _fake_generate_noa_response
 
-        result = module.health_llm(request=None, q="say hello")
+        result = module.health_llm(request=None, response=_response(), q="say hello")
 
         self.assertEqual(result, {"ok": True, "text": "hello"})
         self.assertEqual(
@@ -137,7 +168,7 @@ class HealthLLMTests(unittest.TestCase):
 
         module.stream_noa_response = _fake_stream_noa_response
 
-        result = asyncio.run(module.health_llm_stream(request=None))
+        result = asyncio.run(module.health_llm_stream(request=None, response=_response()))
 
         self.assertEqual(
             captured,
@@ -157,7 +188,7 @@ class HealthLLMTests(unittest.TestCase):
 
         module.stream_noa_response = _fake_stream_noa_response
 
-        result = asyncio.run(module.health_llm_stream(request=None))
+        result = asyncio.run(module.health_llm_stream(request=None, response=_response()))
 
         self.assertEqual(
             result,
@@ -176,7 +207,7 @@ class HealthLLMTests(unittest.TestCase):
         module.iter_chunks_async = _fake_iter_chunks_async
 
         with self.assertRaises(http_exception) as ctx:
-            asyncio.run(module.health_llm_stream(request=None))
+            asyncio.run(module.health_llm_stream(request=None, response=_response()))
 
         self.assertEqual(ctx.exception.status_code, 503)
         self.assertEqual(ctx.exception.detail, "blocked_by_content_filter")
@@ -193,7 +224,7 @@ class HealthLLMTests(unittest.TestCase):
         module.iter_chunks_async = _fake_iter_chunks_async
 
         with self.assertRaises(http_exception) as ctx:
-            asyncio.run(module.health_llm_stream(request=None))
+            asyncio.run(module.health_llm_stream(request=None, response=_response()))
 
         self.assertEqual(ctx.exception.status_code, 503)
         self.assertEqual(ctx.exception.detail, "llm_stream_error: boom")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from app.backend.core import responses
+
+UTF8_JSON = "application/json; charset=utf-8"
+
+
+def _build_client() -> TestClient:
+    app = FastAPI(default_response_class=responses.UTF8ORJSONResponse)
+    app.add_exception_handler(StarletteHTTPException, responses.http_exception_handler)
+    app.add_exception_handler(
+        RequestValidationError, responses.request_validation_exception_handler
+    )
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="항목 없음")
+        return {"item_id": item_id, "label": "감정 카드"}
+
+    return TestClient(app)
+
+
+def test_default_json_response_declares_utf8_charset():
+    response = _build_client().get("/items/1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == UTF8_JSON
+    assert response.json() == {"item_id": 1, "label": "감정 카드"}
+
+
+def test_http_error_response_declares_utf8_charset():
+    client = _build_client()
+
+    raised = client.get("/items/0")
+    assert raised.status_code == 404
+    assert raised.headers["content-type"] == UTF8_JSON
+    assert raised.json() == {"detail": "항목 없음"}
+
+    missing = client.get("/no-such-route")
+    assert missing.status_code == 404
+    assert missing.headers["content-type"] == UTF8_JSON
+    assert missing.json() == {"detail": "Not Found"}
+
+
+def test_validation_error_response_declares_utf8_charset():
+    response = _build_client().get("/items/not-a-number")
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == UTF8_JSON
+    assert response.json()["detail"][0]["loc"] == ["path", "item_id"]
@@ -17,6 +17,17 @@ class StreamBridgeTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(items, ["a", "b"])
 
+    async def test_iter_chunks_async_returns_async_generators_unwrapped(self) -> None:
+        async def _async_source():
+            yield "a"
+            yield "b"
+
+        source = _async_source()
+        stream = iter_chunks_async(source)
+
+        self.assertIs(stream, source)
+        self.assertEqual([item async for item in stream], ["a", "b"])
+
     async def test_iter_chunks_async_propagates_sync_errors(self) -> None:
         def _broken_source():
             yield "a"
@@ -29,6 +40,27 @@ class StreamBridgeTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(items, ["a"])
 
+    async def test_iter_chunks_async_closes_sync_source_on_early_stop(self) -> None:
+        closed = []
+
+        def _long_source():
+            try:
+                for ch in "abcdef":
+                    yield ch
+            finally:
+                closed.append(True)
+
+        stream = iter_chunks_async(_long_source())
+        items = []
+        async for item in stream:
+            items.append(item)
+            if item == "b":
+                break
+        await stream.aclose()
+
+        self.assertEqual(items, ["a", "b"])
+        self.assertEqual(closed, [True])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.backend.models.emotion import EmotionSession, EmotionStep
+from app.backend.models.user import User
+from app.backend.services.task_llm_service import TaskDraft
+from app.backend.services.task_recommend import load_task_recommendation_context, persist_task_drafts
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _make_user(engine):
+    with Session(engine) as db:
+        user = User(name="tester", email="tester@example.com")
+        db.add(user)
+        db.commit()
+        return user.user_id
+
+
+def test_persist_task_drafts_inserts_once_without_refresh(engine):
+    user_id = _make_user(engine)
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split(None, 1)[0].upper())
+
+    drafts = [TaskDraft(title="산책하기", description="10분"), TaskDraft(title="물 마시기", description=None)]
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        with Session(engine) as db:
+            tasks = persist_task_drafts(db, user_id=user_id, drafts=drafts)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert statements.count("INSERT") == 1
+    assert "SELECT" not in statements
+    assert [t.title for t in tasks] == ["산책하기", "물 마시기"]
+    assert all(t.created_at is not None and t.user_id == user_id for t in tasks)
+
+
+def test_load_context_checks_owner_and_keeps_recent_steps(engine):
+    user_id = _make_user(engine)
+    with Session(engine) as db:
+        session = EmotionSession(user_id=user_id, emotion_label="불안", topic="회사")
+        empty = EmotionSession(user_id=user_id)
+        db.add_all([session, empty])
+        db.flush()
+        for order in range(1, 5):
+            db.add(
+                EmotionStep(
+                    session_id=session.session_id,
+                    step_order=order,
+                    step_type="user",
+                    user_input=f"말 {order}",
+                    gpt_response="",
+                )
+            )
+        db.commit()
+        session_id, empty_id = session.session_id, empty.session_id
+
+    with Session(engine) as db:
+        context = load_task_recommendation_context(
+            db, user_id=user_id, session_id=session_id, recent_steps_limit=2
+        )
+        blank = load_task_recommendation_context(db, user_id=user_id, session_id=empty_id)
+        with pytest.raises(ValueError):
+            load_task_recommendation_context(db, user_id=uuid4(), session_id=session_id)
+        with pytest.raises(ValueError):
+            load_task_recommendation_context(db, user_id=user_id, session_id=uuid4())
+
+    assert (context.emotion_label, context.topic) == ("불안", "회사")
+    assert context.history_snippet == "유저: 말 3\nGPT:\n유저: 말 4\nGPT:"
+    assert blank.history_snippet == ""
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "test_secret")
+os.environ.setdefault("JWT_REFRESH_SECRET", "test_refresh")
+
+import pytest
+from jwt import InvalidTokenError as JWTError
+
+from app.backend.core import tokens
+from app.backend.core.token_cache import TokenCache
+
+
+def test_token_cache_returns_copy_until_ttl_expires(monkeypatch):
+    cache = TokenCache(maxsize=10, ttl_sec=30)
+    now = [1000.0]
+    monkeypatch.setattr("app.backend.core.token_cache.time.monotonic", lambda: now[0])
+    cache.put("tok", {"sub": "u1", "exp": time.time() + 600})
+
+    hit = cache.get("tok")
+    assert hit["sub"] == "u1"
+    hit["sub"] = "mutated"
+    assert cache.get("tok")["sub"] == "u1"
+
+    now[0] += 31
+    assert cache.get("tok") is None
+
+
+def test_token_cache_skips_entries_past_token_exp():
+    cache = TokenCache(maxsize=10, ttl_sec=30)
+    cache.put("tok", {"sub": "u1", "exp": time.time() - 1})
+
+    assert cache.get("tok") is None
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2, ttl_sec=30)
+    cache.put("a", {"sub": "a"})
+    cache.put("b", {"sub": "b"})
+    cache.get("a")
+    cache.put("c", {"sub": "c"})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_verify_access_token_decodes_once_per_token(monkeypatch):
+    monkeypatch.setattr(tokens, "_access_cache", TokenCache(maxsize=10, ttl_sec=30))
+    token = tokens.create_access_token("00000000-0000-0000-0000-000000000001")
+    calls = []
+    real_decode = tokens._decode
+
+    def _counting_decode(tok, secret, required):
+        calls.append(tok)
+        return real_decode(tok, secret, required)
+
+    monkeypatch.setattr(tokens, "_decode", _counting_decode)
+
+    assert tokens.verify_access_token(token)["typ"] == "access"
+    assert tokens.verify_access_token(token)["typ"] == "access"
+    assert len(calls) == 1
+
+
+def test_clear_token_cache_drops_refresh_payload(monkeypatch):
+    monkeypatch.setattr(tokens, "_refresh_cache", TokenCache(maxsize=10, ttl_sec=30))
+    jti = tokens.new_refresh_jti()
+    token, _exp = tokens.create_refresh_token("00000000-0000-0000-0000-000000000001", jti)
+    tokens.verify_refresh_token(token)
+
+    tokens.clear_token_cache(jti)
+
+    def _rejecting_decode(tok, secret, required):
+        raise JWTError("revoked")
+
+    monkeypatch.setattr(tokens, "_decode", _rejecting_decode)
+
+    with pytest.raises(JWTError):
+        tokens.verify_refresh_token(token)
+
+
+def test_verify_refresh_token_requires_jti_claim():
+    token = tokens._make_jwt(
+        {"sub": "00000000-0000-0000-0000-000000000001", "typ": "refresh"},
+        tokens._REFRESH_KEY,
+        tokens._now_ts() + 86400,
+    )
+
+    with pytest.raises(JWTError):
+        tokens.verify_refresh_token(token)
+
+
+def test_decode_access_token_accepts_tokens_issued_by_tokens_module():
+    from app.backend.core.jwt import decode_access_token
+
+    token = tokens.create_access_token("00000000-0000-0000-0000-000000000001")
+
+    assert decode_access_token(token)["sub"] == "00000000-0000-0000-0000-000000000001"
+    assert decode_access_token(token + "x") is None
+
+
+def test_make_jwt_matches_pyjwt_encoding():
+    import jwt
+
+    exp_ts = tokens._now_ts() + 300
+    token = tokens._make_jwt({"sub": "u1", "typ": "access"}, tokens._ACCESS_KEY, exp_ts)
+    decoded = jwt.decode(token, tokens._ACCESS_KEY, algorithms=["HS256"])
+
+    assert token == jwt.encode(decoded, tokens._ACCESS_KEY, algorithm="HS256")
+
+
+def test_token_fingerprint_matches_current_and_legacy_hashes():
+    token = "header.payload.signature"
+
+    assert tokens.token_fingerprint_matches(tokens.token_fingerprint(token), token)
+    assert tokens.token_fingerprint_matches(tokens.sha256_hex(token), token)
+    assert not tokens.token_fingerprint_matches(tokens.token_fingerprint("other"), token)
+
+
+def test_refresh_cookie_header_matches_starlette_set_cookie():
+    from starlette.responses import Response
+
+    expected = Response()
+    expected.set_cookie(
+        key=tokens.REFRESH_COOKIE_NAME,
+        value="aa.bb-cc_dd",
+        httponly=True,
+        secure=tokens.AUTH_SETTINGS.secure_refresh_cookie,
+        path="/",
+    )
+    actual = Response()
+    tokens.set_refresh_cookie(actual, "aa.bb-cc_dd")
+
+    assert actual.headers.getlist("set-cookie") == expected.headers.getlist("set-cookie")
+
+
+def test_clear_refresh_cookie_expires_cookie():
+    from starlette.responses import Response
+
+    response = Response()
+    tokens.clear_refresh_cookie(response)
+
+    (header,) = response.headers.getlist("set-cookie")
+    assert header.startswith(f'{tokens.REFRESH_COOKIE_NAME}=""; ')
+    assert "Max-Age=0" in header
+
+
+def test_create_refresh_token_with_hash_fingerprints_issued_token():
+    jti = tokens.new_refresh_jti()
+    token, fingerprint, exp = tokens.create_refresh_token_with_hash(
+        "00000000-0000-0000-0000-000000000001", jti
+    )
+
+    assert fingerprint == tokens.token_fingerprint(token)
+    assert tokens.token_fingerprint_matches(fingerprint, token)
+    assert tokens.verify_refresh_token(token)["jti"] == str(jti)
+    assert exp.tzinfo is not None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.backend.services import web_test_user
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(web_test_user, "_web_test_user_ids", {})
+    monkeypatch.setenv("EMOTION_NO_AUTH_WEB_TEST", "true")
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def test_web_test_user_id_is_looked_up_once(engine, monkeypatch):
+    with Session(engine) as db:
+        created_id = web_test_user.resolve_emotion_user_id(db, None)
+
+    with Session(engine) as db:
+        def _no_select(*args, **kwargs):
+            raise AssertionError("web-test user id should be served from the cache")
+
+        monkeypatch.setattr(db, "exec", _no_select)
+        again = web_test_user.resolve_emotion_user_id(db, None)
+
+    assert again == created_id
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.backend.services import ws_protocol
+
+
+class _FakeWebSocket:
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    async def receive(self) -> dict:
+        return {"type": "websocket.receive", "text": self._text}
+
+
+def _recv(text: str) -> dict | None:
+    return asyncio.run(ws_protocol.ws_recv_safe(_FakeWebSocket(text)))
+
+
+def test_type_only_control_frames_skip_json_parsing(monkeypatch):
+    def _no_parse(_raw):
+        raise AssertionError("control frames should not be parsed")
+
+    monkeypatch.setattr(ws_protocol.orjson, "loads", _no_parse)
+
+    assert _recv('{"type":"ping"}') == {"type": "ping"}
+    assert _recv(' {"type": "confirm_close"}\n') == {"type": "confirm_close"}
+
+
+def test_control_frames_with_fields_are_fully_parsed():
+    assert _recv('{"type":"open","access_token":"abc"}') == {"type": "open", "access_token": "abc"}
+    assert _recv('{"user_input":"안녕"}') == {"type": "message", "text": "안녕"}
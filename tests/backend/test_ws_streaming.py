@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from app.backend.services.ws_streaming import encode_ws_frame, ws_send_safe
+
+
+def test_encode_ws_frame_matches_jsonable_encoder_output():
+    data = {
+        "type": "open_ok",
+        "session_id": uuid4(),
+        "started_at": datetime(2026, 10, 15, 9, 30, 0, 123456),
+        "reason": None,
+        "card": {"label": "불안", "topic": None, "tags": ["일", None]},
+    }
+
+    frame = encode_ws_frame(data)
+
+    assert json.loads(frame) == jsonable_encoder(data, exclude_none=True)
+    assert "불안" in frame
+
+
+def test_ws_send_safe_sends_pre_encoded_frames_as_is():
+    sent = []
+
+    class _FakeWebSocket:
+        async def send_text(self, text: str) -> None:
+            sent.append(text)
+
+    frame = encode_ws_frame({"type": "pong"})
+    asyncio.run(ws_send_safe(_FakeWebSocket(), frame, logger=logging.getLogger(__name__)))
+    asyncio.run(
+        ws_send_safe(_FakeWebSocket(), {"type": "message_end"}, logger=logging.getLogger(__name__))
+    )
+
+    assert sent == ['{"type":"pong"}', '{"type":"message_end"}']
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.backend.services.ws_utils import LeakGuard, transcript_rows_to_conversation
+
+
+def _row(step_type: str, user_input: str = "", gpt_response: str = ""):
+    return SimpleNamespace(step_type=step_type, user_input=user_input, gpt_response=gpt_response)
+
+
+def test_transcript_rows_to_conversation_skips_markers_and_blank_turns():
+    rows = [
+        _row("user", user_input="안녕"),
+        _row("assistant", gpt_response="반가워"),
+        _row("activity_suggest"),
+        _row("user", user_input=""),
+        _row("assistant", gpt_response=""),
+    ]
+
+    assert transcript_rows_to_conversation(rows) == [("user", "안녕"), ("assistant", "반가워")]
+    assert transcript_rows_to_conversation(rows, "오늘은") == [
+        ("user", "안녕"),
+        ("assistant", "반가워"),
+        ("user", "오늘은"),
+    ]
+
+
+def test_leak_guard_reuses_system_prompt_fingerprint():
+    prompt = "너는 감정 코치 노아다. 사용자의 감정을 부드럽게 되짚어 준다. " * 4
+    first = LeakGuard().fingerprint(prompt)
+    second = LeakGuard().fingerprint(prompt)
+
+    assert first is second
+    assert LeakGuard()._might_leak(prompt[:120], first)
+    assert not LeakGuard()._might_leak("오늘 점심은 비빔밥이었어", first)
+
+
+def test_leak_guard_redacts_all_markers_in_one_pass():
+    out = LeakGuard().sanitize_out("<<SYS>> 규칙 [ system ] 그리고 do not disclose", frozenset())
+
+    assert out == "[redacted] 규칙 [redacted] 그리고 [redacted]"
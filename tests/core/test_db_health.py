@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+
+from app.db import health
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(monkeypatch):
+    monkeypatch.setattr(health, "_health_cache", {})
+    monkeypatch.setattr(health, "HEALTH_DB_CACHE_TTL_SEC", 5.0)
+
+
+def test_health_db_response_reuses_result_within_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(health, "check_db_tables", lambda *args: calls.append(args))
+
+    assert health.health_db_response(object(), ("user",), "core") == {"ok": True}
+    assert health.health_db_response(object(), ("user",), "core") == {"ok": True}
+
+    assert len(calls) == 1
+
+
+def test_health_db_response_caches_failures_and_rechecks_after_ttl(monkeypatch):
+    calls = []
+
+    def _fail(*args):
+        calls.append(args)
+        raise RuntimeError("missing table: user")
+
+    monkeypatch.setattr(health, "check_db_tables", _fail)
+    clock = iter([100.0, 100.0, 101.0, 106.0, 106.0, 106.0])
+    monkeypatch.setattr(health.time, "monotonic", lambda: next(clock))
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            health.health_db_response(object(), ("user",), "core")
+        assert exc_info.value.detail == "missing table: user"
+    assert len(calls) == 1
+
+    with pytest.raises(HTTPException):
+        health.health_db_response(object(), ("user",), "core")
+    assert len(calls) == 2
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from app.db import session
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("postgres://u:p@db.example.com/app", "postgresql+psycopg://u:p@db.example.com/app"),
+        ("postgresql://u:p@db.example.com/app", "postgresql+psycopg://u:p@db.example.com/app"),
+        (
+            "postgresql+psycopg2://u:p@db.example.com/app",
+            "postgresql+psycopg2://u:p@db.example.com/app",
+        ),
+    ],
+)
+def test_build_db_url_defaults_to_psycopg3(monkeypatch, raw, expected):
+    monkeypatch.setenv("DATABASE_URL", raw)
+
+    assert session._build_db_url().render_as_string(hide_password=False) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected_query"),
+    [
+        ("postgresql://u:p@dpg-abc.oregon-postgres.render.com/app", {"sslmode": "require"}),
+        ("postgresql://u:p@ep-abc.aws.neon.tech/app?sslmode=verify-full", {"sslmode": "verify-full"}),
+        ("postgresql://u:p@db.example.com/app", {}),
+        ("sqlite:///./local.db", {}),
+    ],
+)
+def test_build_db_url_requires_ssl_for_hosted_domains(monkeypatch, raw, expected_query):
+    monkeypatch.setenv("DATABASE_URL", raw)
+
+    assert dict(session._build_db_url().query) == expected_query
+
+
+def test_build_db_url_from_postgres_parts_keeps_special_password(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "")
+    monkeypatch.setenv("POSTGRES_HOST", "db.neon.tech")
+    monkeypatch.setenv("POSTGRES_DB", "app")
+    monkeypatch.setenv("POSTGRES_USER", "u")
+    monkeypatch.setenv("POSTGRES_PASSWORD", "p@ss:w/rd")
+
+    url = session._build_db_url()
+
+    assert url.drivername == session.PG_DRIVER_NAME
+    assert url.password == "p@ss:w/rd"
+    assert url.query["sslmode"] == "require"
+    assert "p@ss" not in url.render_as_string(hide_password=True)
+
+
+def test_engine_options_enable_prepared_statements_for_psycopg3(monkeypatch):
+    monkeypatch.delenv("APP_ENV", raising=False)
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "0")
+
+    options = session._engine_options(make_url("postgresql+psycopg://u:p@db.example.com/app"))
+    assert options["connect_args"]["prepare_threshold"] is None
+
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD")
+    options = session._engine_options(make_url("postgresql+psycopg://u:p@db.example.com/app"))
+    assert options["connect_args"]["prepare_threshold"] == 5
+
+    legacy = session._engine_options(make_url("postgresql+psycopg2://u:p@db.example.com/app"))
+    assert "prepare_threshold" not in legacy["connect_args"]
@@ -285,3 +285,50 @@ def test_responses_input_uses_output_text_for_assistant_history():
     assert payload[0]["content"] == [{"type": "input_text", "text": "System"}]
     assert payload[1]["content"] == [{"type": "output_text", "text": "Earlier reply"}]
     assert payload[2]["content"] == [{"type": "input_text", "text": "Latest user message"}]
+
+
+def test_get_client_builds_openai_client_once_and_reuses_it(monkeypatch):
+    from app.core.llm import openai_provider as module
+
+    created = []
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.with_options_calls = []
+
+        def with_options(self, **kwargs):
+            self.with_options_calls.append(kwargs)
+            return self
+
+    monkeypatch.setattr(module, "OpenAI", FakeOpenAI)
+    provider = OpenAIProvider(settings=_build_settings("gpt-4.1-mini"))
+
+    first = provider._get_client(timeout_sec=12.0)
+    second = provider._get_client(timeout_sec=12.0)
+    provider._get_client(timeout_sec=30.0)
+
+    assert first is second
+    assert len(created) == 1
+    assert created[0]["timeout"] == 12.0
+    assert first.with_options_calls == [{"timeout": 30.0}]
+
+
+def test_owned_clients_share_one_http_connection_pool(monkeypatch):
+    from app.core.llm import openai_provider as module
+
+    created = []
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    monkeypatch.setattr(module, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(module, "_shared_http_client", None)
+
+    OpenAIProvider(settings=_build_settings("gpt-4.1-mini"))._get_client(timeout_sec=12.0)
+    OpenAIProvider(settings=_build_settings("gpt-4o-mini"))._get_client(timeout_sec=12.0)
+
+    assert len(created) == 2
+    assert created[0]["http_client"] is created[1]["http_client"]
+    assert created[0]["http_client"] is module._get_shared_http_client()
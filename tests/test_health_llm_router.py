@@ -6,7 +6,7 @@ import sys
 from pathlib import Path
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 os.environ.setdefault("RATELIMIT_ENABLED", "false")
 os.environ.setdefault("JWT_SECRET_KEY", "test-health-router-secret")
@@ -18,6 +18,11 @@ if str(ROOT) not in sys.path:
 from app.backend.routers import health_llm
 
 
+@pytest.fixture(autouse=True)
+def _clear_probe_cache():
+    health_llm._probe_cache.clear()
+
+
 def test_health_llm_calls_generate_with_current_signature(monkeypatch):
     captured: dict = {}
 
@@ -37,7 +42,7 @@ def test_health_llm_calls_generate_with_current_signature(monkeypatch):
 
     monkeypatch.setattr(health_llm, "generate_noa_response", fake_generate_noa_response)
 
-    result = health_llm.health_llm(request=None, q=None)
+    result = health_llm.health_llm(request=None, response=Response(), q=None)
 
     assert result["ok"] is True
     assert "pong" in result["text"].lower()
@@ -66,7 +71,7 @@ def test_health_llm_stream_ok_and_contract(monkeypatch):
 
     monkeypatch.setattr(health_llm, "stream_noa_response", fake_stream_noa_response)
 
-    result = asyncio.run(health_llm.health_llm_stream(request=None, q=None))
+    result = asyncio.run(health_llm.health_llm_stream(request=None, response=Response(), q=None))
 
     assert result["ok"] is True
     assert result["tokens"] == 2
@@ -84,7 +89,7 @@ def test_health_llm_stream_maps_blocked_by_content_filter(monkeypatch):
     monkeypatch.setattr(health_llm, "stream_noa_response", fake_stream_noa_response)
 
     with pytest.raises(HTTPException) as excinfo:
-        asyncio.run(health_llm.health_llm_stream(request=None, q=None))
+        asyncio.run(health_llm.health_llm_stream(request=None, response=Response(), q=None))
 
     assert excinfo.value.status_code == 503
     assert excinfo.value.detail == "blocked_by_content_filter"
@@ -97,7 +102,7 @@ def test_health_llm_stream_empty_response(monkeypatch):
     monkeypatch.setattr(health_llm, "stream_noa_response", fake_stream_noa_response)
 
     with pytest.raises(HTTPException) as excinfo:
-        asyncio.run(health_llm.health_llm_stream(request=None, q=None))
+        asyncio.run(health_llm.health_llm_stream(request=None, response=Response(), q=None))
 
     assert excinfo.value.status_code == 503
     assert excinfo.value.detail == "llm_stream_empty"